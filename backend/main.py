@@ -7,6 +7,7 @@ import logging
 
 from routes.api import router as api_router
 from database import init_database
+from utils.certificate_generator import get_certificate_generator
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -86,6 +87,8 @@ async def startup_event():
     """Initialize application on startup"""
     logger.info("ZeroTrace Backend starting up...")
     logger.info("Database initialized successfully")
+    # Start loading/generating the signing keys in the background so the first report doesn't wait
+    get_certificate_generator()
 
 @app.on_event("shutdown")
 async def shutdown_event():
@@ -108,7 +108,7 @@ def api_wipe_file(req: FileWipeRequest):
 
     try:
         from services.wipe_methods import WipeMethods
-        from utils.report import generate_pdf_report, generate_json_report
+        from utils.report import generate_reports
         import time
 
         methods = WipeMethods(os.name)
@@ -130,8 +130,7 @@ def api_wipe_file(req: FileWipeRequest):
 
         # After wipe, file is deleted; sha_after is None
         sha_after = None
-        pdf = generate_pdf_report("file:" + req.path, "nist_800_88", max(1, min(req.passes, 3)), sha_before, sha_after, "completed" if success else "failed", start_ts, end_ts)
-        _ = generate_json_report("file:" + req.path, "nist_800_88", max(1, min(req.passes, 3)), sha_before, sha_after, "completed" if success else "failed", start_ts, end_ts)
+        pdf, _ = generate_reports("file:" + req.path, "nist_800_88", max(1, min(req.passes, 3)), sha_before, sha_after, "completed" if success else "failed", start_ts, end_ts)
 
         return {"success": success, "report": pdf}
     except Exception as e:
@@ -8,7 +8,7 @@ from typing import Dict, Any, List, Optional, Callable, Tuple
 from database import init_database, get_db_session, create_device, get_device_by_path, create_wipe_session, update_wipe_session, add_progress_update
 from services.secure_wipe import SecureWipeService, WipeMethod
 from services.wipe_methods import WipeMethods
-from utils.report import generate_pdf_report, sign_report_with_openssl, generate_json_report
+from utils.report import generate_reports, sign_report_with_openssl
 from models import WipeStatus
 
 # Initialize database
@@ -378,13 +378,7 @@ def initiate_wipe(device: str, method: str, passes: int = 1, force: bool = False
         # Generate reports
         end_ts = time.time()
         start_ts = end_ts - result.get("duration", 0)
-        report_path = generate_pdf_report(
-            device, method, passes, sha_before, sha_after,
-            "completed" if result["success"] else "failed",
-            start_ts, end_ts
-        )
-        
-        json_report_path = generate_json_report(
+        report_path, json_report_path = generate_reports(
             device, method, passes, sha_before, sha_after,
             "completed" if result["success"] else "failed",
             start_ts, end_ts
@@ -2,15 +2,524 @@
 Implementation of specific wipe methods for secure data erasure
 """
 
+import io
 import os
+import errno
+import mmap
 import time
 import subprocess
 import secrets
+import functools
+import threading
 from typing import Optional, Callable, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Streaming chunk size shared by the device write paths
+_CHUNK_SIZE = 16 * 1024 * 1024
+
+# Shared zero chunk; an untouched anonymous mapping is page aligned (for O_DIRECT) and costs no RSS
+_ZERO_CHUNK = memoryview(mmap.mmap(-1, _CHUNK_SIZE))
+
+# Prebuilt pattern tiles kept per WipeMethods instance (bounded: Gutmann alone has 27 patterns)
+_PATTERN_CACHE_LIMIT = 4
+
+
+def _target_size(fd: int) -> Optional[int]:
+    """Size in bytes of an open file or block device, or None if it cannot be determined."""
+    try:
+        size = os.lseek(fd, 0, os.SEEK_END)
+        os.lseek(fd, 0, os.SEEK_SET)
+        return size or None
+    except OSError:
+        return None
+
+
+def _sysfs_rotational(device_path: str) -> Optional[bool]:
+    """``queue/rotational`` of a Linux block device (a partition reads its parent disk's), or None."""
+    name = os.path.basename(os.path.realpath(device_path))
+    node = os.path.realpath(f"/sys/class/block/{name}")
+    for directory in (node, os.path.dirname(node)):
+        try:
+            with open(os.path.join(directory, "queue", "rotational")) as fh:
+                return fh.read().strip() == "1"
+        except OSError:
+            continue
+    return None
+
+
+def _fdatasync(fd: int) -> None:
+    """fdatasync where available (skips the metadata-only flush), fsync elsewhere."""
+    getattr(os, "fdatasync", os.fsync)(fd)
+
+
+def _open_direct(device_path: str) -> int:
+    """Open for writing with O_DIRECT where supported (Linux), bypassing the page cache."""
+    direct = getattr(os, "O_DIRECT", 0)
+    if direct:
+        try:
+            return os.open(device_path, os.O_WRONLY | direct)
+        except OSError as e:
+            if e.errno != errno.EINVAL:
+                raise
+            # Filesystems such as tmpfs reject O_DIRECT; fall through to buffered I/O
+    return os.open(device_path, os.O_WRONLY)
+
+
+def _is_direct(fd: int) -> bool:
+    """True if ``fd`` is currently open with O_DIRECT."""
+    direct = getattr(os, "O_DIRECT", 0)
+    if not direct:
+        return False
+    import fcntl
+    return bool(fcntl.fcntl(fd, fcntl.F_GETFL) & direct)
+
+
+def _direct_write(fd: int, buffer: memoryview, length: int, source: Optional[int] = None) -> int:
+    """Write ``buffer[:length]``, leaving O_DIRECT for an unaligned tail.
+
+    When ``source`` is an open /dev/zero fd the bytes are spliced in-kernel with
+    sendfile instead of being copied from ``buffer`` (which must then be zeroed).
+    """
+    if length % _DIRECT_ALIGNMENT and getattr(os, "O_DIRECT", 0):
+        import fcntl
+        fcntl.fcntl(fd, fcntl.F_SETFL, fcntl.fcntl(fd, fcntl.F_GETFL) & ~os.O_DIRECT)
+    if source is not None and hasattr(os, "sendfile"):
+        try:
+            return os.sendfile(fd, source, None, length)
+        except OSError as e:
+            if e.errno not in (errno.EINVAL, errno.ENOSYS):
+                raise
+    return os.write(fd, buffer[:length])
+
+
+def _open_zero_source() -> Optional[int]:
+    """Open /dev/zero as a sendfile source, or None where it is unavailable."""
+    try:
+        return os.open("/dev/zero", os.O_RDONLY)
+    except OSError:
+        return None
+
+
+def _fadvise(fd: int, advice: str) -> None:
+    """Best-effort posix_fadvise over the whole file (no-op where unsupported)."""
+    if hasattr(os, "posix_fadvise") and hasattr(os, advice):
+        try:
+            os.posix_fadvise(fd, 0, 0, getattr(os, advice))
+        except OSError:
+            pass
+
+
+def _throttled_progress(progress_callback: Optional[Callable], interval: float = 0.2) -> Callable:
+    """Wrap ``progress_callback`` so it only fires when the percentage changes, at most every ``interval`` s.
+
+    Pass ``force=True`` for updates that must always be delivered (e.g. end of a pass).
+    """
+    last = {"pct": None, "at": 0.0}
+
+    def report(pct: int, message: str, force: bool = False) -> None:
+        if not progress_callback:
+            return
+        now = time.monotonic()
+        if force or (pct != last["pct"] and now - last["at"] >= interval):
+            last["pct"], last["at"] = pct, now
+            progress_callback(pct, message)
+
+    return report
+
+
+def _pattern_tile(pattern: bytes, size: int) -> bytes:
+    """``pattern`` repeated to exactly ``size`` bytes."""
+    return (pattern * (size // len(pattern) + 1))[:size]
+
+
+def _fill_tile(buf, pattern: bytes) -> None:
+    """Fill a writable buffer with ``pattern`` using log2(n) doubling copies (each one a memmove)."""
+    view = memoryview(buf)
+    size = len(view)
+    filled = min(len(pattern), size)
+    view[:filled] = pattern[:filled]
+    while filled < size:
+        step = min(filled, size - filled)
+        view[filled:filled + step] = view[:step]
+        filled += step
+    view.release()
+
+
+def _make_filler(pattern: Optional[bytes], size: int) -> Callable[[int], memoryview]:
+    """Return ``fill(n)`` giving the next ``n`` bytes to write from one reused buffer.
+
+    Patterns are filled once up front; ``None`` regenerates a random keystream in place.
+    """
+    buf = bytearray(size)
+    view = memoryview(buf)
+    if pattern is None:
+        keystream = _new_keystream()
+        zeros = memoryview(bytes(size))
+
+        def fill(n: int) -> memoryview:
+            keystream.update_into(zeros[:n], view[:n])
+            return view[:n]
+
+        return fill
+    _fill_tile(buf, pattern)
+    return lambda n: view[:n]
+
+
+def _tile_memfd(tile: bytes) -> Optional[int]:
+    """Anonymous in-memory file holding ``tile`` for sendfile(), or None where memfd is unavailable."""
+    if not hasattr(os, "memfd_create"):
+        return None
+    try:
+        fd = os.memfd_create("zerotrace_tile")
+    except OSError:
+        return None
+    try:
+        view = memoryview(tile)
+        while view:
+            view = view[os.write(fd, view):]
+        return fd
+    except OSError:
+        os.close(fd)
+        return None
+
+
+def _new_keystream():
+    """AES-256-CTR keystream seeded once from the OS CSPRNG; fill buffers with update_into().
+
+    OpenSSL uses AES-NI where present, which outruns both getrandom() and ChaCha20.
+    """
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    return Cipher(algorithms.AES(os.urandom(32)), modes.CTR(os.urandom(16))).encryptor()
+
+
+# Bytes sampled per region by _verify_zeroed, and the all-zero reference they are compared to
+_VERIFY_SAMPLE_SIZE = 1024 * 1024
+_ZERO_SAMPLE = bytes(_VERIFY_SAMPLE_SIZE)
+
+# Chunks submitted per writev() call when overwriting files with a fixed pattern
+_WRITEV_BATCH = 16
+
+# O_DIRECT transfers must be a multiple of the logical block size; 4 KiB covers both 512e and 4Kn
+_DIRECT_ALIGNMENT = 4096
+
+# NVMe only reaches full bandwidth with many commands outstanding: full-device overwrites
+# keep this many block-sized pwrites in flight (each blocks in the kernel without the GIL)
+_NVME_QUEUE_DEPTH = 32
+_QUEUE_BLOCK = 1024 * 1024
+
+# Gutmann patterns for maximum security. Only the short patterns live at module level:
+# tiles are expanded per block into one reused buffer, so pre-baking 16 MiB per pattern
+# here would just pin ~560 MiB of RSS on import.
+_GUTMANN_PATTERNS = (
+    b'\x55', b'\xAA', b'\x92\x49\x24', b'\x49\x24\x92',
+    b'\x24\x92\x49', b'\x00', b'\x11', b'\x22', b'\x33',
+    b'\x44', b'\x55', b'\x66', b'\x77', b'\x88', b'\x99',
+    b'\xAA', b'\xBB', b'\xCC', b'\xDD', b'\xEE', b'\xFF',
+    b'\x92\x49\x24\x49', b'\x49\x24\x92\x24', b'\x24\x92\x49\x92',
+    b'\x6D\xB6\xDB\x6D', b'\xB6\xDB\x6D\xB6', b'\xDB\x6D\xB6\xDB',
+    b'\x00', b'\x11', b'\x22', b'\x33', b'\x44', b'\x55',
+    b'\x66', b'\x77', b'\x88', b'\x99', b'\xAA', b'\xBB',
+    b'\xCC', b'\xDD', b'\xEE', b'\xFF',
+)
+
+# Bounds (seconds) of the exponential backoff between sanitize status polls
+_SANITIZE_POLL_MIN = 1.0
+_SANITIZE_POLL_MAX = 30.0
+
+# Blocks zeroed before the linear sweep: both ends (partition tables, superblocks, backup GPT)
+# plus evenly spaced strides, so an interrupted overwrite already leaves the disk unusable
+_PRIORITY_BLOCK = 1024 * 1024
+_PRIORITY_STRIDES = 64
+
+
+def _priority_offsets(size: int) -> list:
+    """Aligned offsets of the blocks to overwrite before the sequential pass, in ascending order."""
+    def align(pos: int) -> int:
+        return pos // _DIRECT_ALIGNMENT * _DIRECT_ALIGNMENT
+    # Strides never closer than one block, so small targets don't rewrite the same bytes
+    step = max(_PRIORITY_BLOCK, size // _PRIORITY_STRIDES)
+    offsets = {0, align(max(0, size - _PRIORITY_BLOCK))}
+    offsets.update(align(pos) for pos in range(step, size - _PRIORITY_BLOCK, step))
+    return sorted(offsets)
+
+
+def _overwrite_priority_blocks(fd: int, size: int, buffer: memoryview) -> None:
+    """pwrite zeros at each _priority_offsets() block (whole aligned blocks only) and sync once."""
+    for pos in _priority_offsets(size):
+        length = min(_PRIORITY_BLOCK, size - pos) // _DIRECT_ALIGNMENT * _DIRECT_ALIGNMENT
+        if not length:
+            continue
+        try:
+            os.pwrite(fd, buffer[:length], pos)
+        except OSError:
+            break
+    _fdatasync(fd)
+
+
+def _overwrite_queued(fd: int, size: int, buffer: memoryview,
+                      on_progress: Callable[[int], None]) -> None:
+    """pwrite ``buffer`` over ``size`` bytes of ``fd`` with up to _NVME_QUEUE_DEPTH writes in flight.
+
+    Blocks go out at explicit offsets, so they may complete in any order; the unaligned
+    tail of an O_DIRECT fd, if any, is written last and synchronously.
+    """
+    aligned_end = size // _DIRECT_ALIGNMENT * _DIRECT_ALIGNMENT
+    done = 0
+    with ThreadPoolExecutor(max_workers=_NVME_QUEUE_DEPTH) as pool:
+        inflight = set()
+        for pos in range(0, aligned_end, _QUEUE_BLOCK):
+            if len(inflight) >= _NVME_QUEUE_DEPTH:
+                finished, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                done += sum(f.result() for f in finished)
+                on_progress(done)
+            inflight.add(pool.submit(os.pwrite, fd, buffer[:min(_QUEUE_BLOCK, aligned_end - pos)], pos))
+        done += sum(f.result() for f in inflight)
+    if aligned_end < size:
+        os.lseek(fd, aligned_end, os.SEEK_SET)
+        done += _direct_write(fd, buffer, size - aligned_end)
+    on_progress(done)
+
+
+# <linux/fs.h>: BLKDISCARD = _IO(0x12, 119), takes a (start, length) uint64 pair
+_BLKDISCARD = 0x1277
+
+# <linux/nvme_ioctl.h>: NVME_IOCTL_ID = _IO('N', 0x40),
+# NVME_IOCTL_ADMIN_CMD = _IOWR('N', 0x41, struct nvme_passthru_cmd); BLKRRPART = _IO(0x12, 95)
+_NVME_IOCTL_ID = 0x4E40
+_NVME_IOCTL_ADMIN_CMD = 0xC0484E41
+_BLKRRPART = 0x125F
+_NVME_ADMIN_IDENTIFY = 0x06
+_NVME_ADMIN_FORMAT_NVM = 0x80
+_NVME_ALL_NAMESPACES = 0xFFFFFFFF
+_NVME_FORMAT_TIMEOUT_MS = 10 * 60 * 1000
+# errno values meaning the passthrough ioctl itself is unavailable, so nvme-cli may try instead
+_NVME_IOCTL_UNSUPPORTED = (errno.ENOTTY, errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP)
+
+
+class _NvmeStatusError(Exception):
+    """The drive completed an NVMe admin command with a non-zero status."""
+
+
+@functools.lru_cache(maxsize=None)
+def _nvme_passthru_cmd():
+    """ctypes layout of ``struct nvme_passthru_cmd`` (72 bytes)."""
+    import ctypes
+
+    class NvmePassthruCmd(ctypes.Structure):
+        _fields_ = [
+            ("opcode", ctypes.c_uint8), ("flags", ctypes.c_uint8), ("rsvd1", ctypes.c_uint16),
+            ("nsid", ctypes.c_uint32), ("cdw2", ctypes.c_uint32), ("cdw3", ctypes.c_uint32),
+            ("metadata", ctypes.c_uint64), ("addr", ctypes.c_uint64),
+            ("metadata_len", ctypes.c_uint32), ("data_len", ctypes.c_uint32),
+            ("cdw10", ctypes.c_uint32), ("cdw11", ctypes.c_uint32), ("cdw12", ctypes.c_uint32),
+            ("cdw13", ctypes.c_uint32), ("cdw14", ctypes.c_uint32), ("cdw15", ctypes.c_uint32),
+            ("timeout_ms", ctypes.c_uint32), ("result", ctypes.c_uint32),
+        ]
+
+    return NvmePassthruCmd
+
+
+def _nvme_admin(fd: int, opcode: int, nsid: int, cdw10: int = 0,
+                data=None, timeout_ms: int = 0) -> None:
+    """Issue one NVMe admin command through the kernel passthrough ioctl.
+
+    Raises OSError for transport errors and _NvmeStatusError for a non-zero NVMe completion status.
+    """
+    import ctypes, fcntl
+    cmd = _nvme_passthru_cmd()(opcode=opcode, nsid=nsid, cdw10=cdw10, timeout_ms=timeout_ms)
+    if data is not None:
+        cmd.addr = ctypes.addressof(data)
+        cmd.data_len = ctypes.sizeof(data)
+    status = fcntl.ioctl(fd, _NVME_IOCTL_ADMIN_CMD, cmd)
+    if status:
+        raise _NvmeStatusError(f"NVMe admin command 0x{opcode:02x} failed with status 0x{status:x}")
+
+
+def _nvme_format_ioctl(device_path: str, ses: int) -> None:
+    """Format NVM with Secure Erase Settings ``ses`` (1 = user data, 2 = crypto), keeping the LBA format.
+
+    Works on a namespace block device (that namespace) or a controller char device (all namespaces).
+    """
+    import ctypes, fcntl, stat
+    fd = os.open(device_path, os.O_RDONLY)
+    try:
+        if stat.S_ISBLK(os.fstat(fd).st_mode):
+            nsid = fcntl.ioctl(fd, _NVME_IOCTL_ID)
+        else:
+            nsid = _NVME_ALL_NAMESPACES
+        # Identify Namespace (CNS 0); FLBAS at byte 26 holds the in-use LBA format and metadata mode,
+        # which must be passed back or the format would silently change the sector size
+        identify = (ctypes.c_uint8 * 4096)()
+        _nvme_admin(fd, _NVME_ADMIN_IDENTIFY, 1 if nsid == _NVME_ALL_NAMESPACES else nsid, 0, identify)
+        flbas = identify[26]
+        lbaf = (flbas & 0x0F) | (((flbas >> 5) & 0x03) << 4)
+        cdw10 = (lbaf & 0x0F) | (((flbas >> 4) & 0x01) << 4) | (ses << 9) | ((lbaf >> 4) << 12)
+        _nvme_admin(fd, _NVME_ADMIN_FORMAT_NVM, nsid, cdw10, timeout_ms=_NVME_FORMAT_TIMEOUT_MS)
+        if stat.S_ISBLK(os.fstat(fd).st_mode):
+            try:
+                fcntl.ioctl(fd, _BLKRRPART)
+            except OSError:
+                pass
+    finally:
+        os.close(fd)
+
+
+# Win32 constants used by the ctypes write path
+_GENERIC_READ = 0x80000000
+_GENERIC_WRITE = 0x40000000
+_FILE_SHARE_READ_WRITE = 0x00000003
+_OPEN_EXISTING = 3
+_FILE_FLAG_WRITE_THROUGH = 0x80000000
+_FILE_FLAG_NO_BUFFERING = 0x20000000
+# WriteFile errors that mean the end of the target was reached rather than a failure
+_WIN_END_OF_MEDIA = {
+    38,   # ERROR_HANDLE_EOF
+    27,   # ERROR_SECTOR_NOT_FOUND
+    112,  # ERROR_DISK_FULL
+}
+_IOCTL_DISK_GET_LENGTH_INFO = 0x0007405C
+_IOCTL_DISK_GET_DRIVE_GEOMETRY = 0x00070000
+_WIN_DEFAULT_SECTOR = 512
+
+
+@functools.lru_cache(maxsize=None)
+def _kernel32():
+    """kernel32 handle with prototypes set for the calls used below (handles are pointer-sized)."""
+    import ctypes
+    from ctypes import wintypes
+    k32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    k32.CreateFileW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD, wintypes.LPVOID,
+                                wintypes.DWORD, wintypes.DWORD, wintypes.HANDLE]
+    k32.CreateFileW.restype = wintypes.HANDLE
+    k32.WriteFile.argtypes = [wintypes.HANDLE, wintypes.LPCVOID, wintypes.DWORD,
+                              ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID]
+    k32.WriteFile.restype = wintypes.BOOL
+    k32.DeviceIoControl.argtypes = [wintypes.HANDLE, wintypes.DWORD, wintypes.LPVOID, wintypes.DWORD,
+                                    wintypes.LPVOID, wintypes.DWORD, ctypes.POINTER(wintypes.DWORD), wintypes.LPVOID]
+    k32.DeviceIoControl.restype = wintypes.BOOL
+    k32.GetFileSizeEx.argtypes = [wintypes.HANDLE, ctypes.POINTER(ctypes.c_longlong)]
+    k32.GetFileSizeEx.restype = wintypes.BOOL
+    k32.FlushFileBuffers.argtypes = [wintypes.HANDLE]
+    k32.CloseHandle.argtypes = [wintypes.HANDLE]
+    return k32
+
+
+def _win_target_size(handle) -> Optional[int]:
+    """Size of a PhysicalDrive (IOCTL_DISK_GET_LENGTH_INFO) or regular file (GetFileSizeEx)."""
+    import ctypes
+    from ctypes import wintypes
+    k32 = _kernel32()
+    length = ctypes.c_longlong(0)
+    returned = wintypes.DWORD(0)
+    if k32.DeviceIoControl(handle, _IOCTL_DISK_GET_LENGTH_INFO, None, 0,
+                           ctypes.byref(length), ctypes.sizeof(length), ctypes.byref(returned), None):
+        return length.value or None
+    if k32.GetFileSizeEx(handle, ctypes.byref(length)):
+        return length.value or None
+    return None
+
+
+def _win_sector_size(handle) -> int:
+    """Logical sector size from IOCTL_DISK_GET_DRIVE_GEOMETRY (512 when it can't be read)."""
+    import ctypes
+    from ctypes import wintypes
+    geometry = (ctypes.c_ubyte * 24)()  # DISK_GEOMETRY; BytesPerSector is the DWORD at offset 20
+    returned = wintypes.DWORD(0)
+    if _kernel32().DeviceIoControl(handle, _IOCTL_DISK_GET_DRIVE_GEOMETRY, None, 0,
+                                   ctypes.byref(geometry), ctypes.sizeof(geometry),
+                                   ctypes.byref(returned), None):
+        sector = int.from_bytes(bytes(geometry[20:24]), "little")
+        if sector:
+            return sector
+    return _WIN_DEFAULT_SECTOR
+
+
+def _win_write_stream(device_path: str, buf: mmap.mmap,
+                      refill: Optional[Callable[[int], None]] = None) -> None:
+    """Stream ``buf`` across a Windows target with WriteFile, calling ``refill(n)`` before each write.
+
+    Raw devices (``\\\\.\\...``) are opened unbuffered; ``buf`` is an mmap, so it is
+    page aligned and every chunk is a whole number of sectors, as NO_BUFFERING requires.
+    """
+    import ctypes
+    from ctypes import wintypes
+    k32 = _kernel32()
+    flags = _FILE_FLAG_WRITE_THROUGH
+    if device_path.startswith("\\\\.\\"):
+        flags |= _FILE_FLAG_NO_BUFFERING
+    # Read access is required for the size/geometry IOCTLs, not just for reading data
+    handle = k32.CreateFileW(device_path, _GENERIC_READ | _GENERIC_WRITE, _FILE_SHARE_READ_WRITE, None,
+                             _OPEN_EXISTING, flags, None)
+    if handle is None or handle == wintypes.HANDLE(-1).value:
+        raise ctypes.WinError(ctypes.get_last_error())
+    try:
+        size = _win_target_size(handle)
+        sector = _win_sector_size(handle) if size is None else None
+        cbuf = (ctypes.c_char * len(buf)).from_buffer(buf)
+        written = wintypes.DWORD(0)
+        processed = 0
+        chunk = len(buf)
+        while size is None or processed < size:
+            to_write = chunk if size is None else min(chunk, size - processed)
+            if refill:
+                refill(to_write)
+            if not k32.WriteFile(handle, cbuf, to_write, ctypes.byref(written), None):
+                error = ctypes.get_last_error()
+                if error in _WIN_END_OF_MEDIA:
+                    # Size unknown: the last chunk overran the end. Halve it (staying
+                    # sector aligned) so the tail of the target still gets written.
+                    if size is None and chunk > sector:
+                        chunk = max(sector, (chunk // 2) // sector * sector)
+                        continue
+                    break
+                raise ctypes.WinError(error)
+            if not written.value:
+                break
+            processed += written.value
+        k32.FlushFileBuffers(handle)
+        del cbuf
+    finally:
+        k32.CloseHandle(handle)
+
+
+class _PowerShellSession:
+    """One long-lived ``powershell -Command -`` process that runs scripts fed over stdin.
+
+    Avoids the CLR start-up (~300 ms) a fresh ``powershell -Command`` pays on every call.
+    """
+
+    def __init__(self):
+        self._proc = None
+        self._lock = threading.Lock()
+
+    def run(self, script: str) -> str:
+        """Run a single-line ``script`` and return its output.
+
+        Raises CalledProcessError if the last native command exits non-zero.
+        """
+        with self._lock:
+            if self._proc is None or self._proc.poll() is not None:
+                self._proc = subprocess.Popen(
+                    ["powershell", "-NoLogo", "-NoProfile", "-NonInteractive", "-Command", "-"],
+                    stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+            # Output is read up to a per-call marker that also carries the exit code
+            marker = f"__zerotrace_{secrets.token_hex(8)}__"
+            self._proc.stdin.write(f"$LASTEXITCODE = 0; {script}\nWrite-Output \"{marker}$LASTEXITCODE\"\n")
+            self._proc.stdin.flush()
+            output = []
+            for line in self._proc.stdout:
+                if line.startswith(marker):
+                    code = int(line[len(marker):].strip() or 0)
+                    if code:
+                        raise subprocess.CalledProcessError(code, script, "".join(output))
+                    return "".join(output)
+                output.append(line)
+            raise subprocess.CalledProcessError(self._proc.wait(), script, "".join(output))
+
+
 class WipeMethods:
     """Implementation of various wipe methods"""
     
@@ -19,6 +528,9 @@ class WipeMethods:
         self.is_windows = system == "windows"
         self.is_linux = system == "linux"
         self.is_macos = system == "darwin"
+        self._pattern_cache: Dict[bytes, bytes] = {}
+        # Started on first use; shared by every Windows helper on this instance
+        self._powershell = _PowerShellSession() if self.is_windows else None
     
     def crypto_erase(self, device_path: str, device_type: str, 
                     progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
@@ -46,16 +558,26 @@ class WipeMethods:
             if progress_callback:
                 progress_callback(10, "Formatting NVMe device with crypto erase...")
             
-            # Use nvme format command with crypto erase
-            result = subprocess.run(
-                ["nvme", "format", device_path, "--ses=1", "--pi=0"],
-                capture_output=True, text=True, check=True
-            )
+            # Format NVM with crypto erase, straight through the admin passthrough ioctl;
+            # nvme-cli is only needed where the ioctl is unavailable (non-Linux, old kernels)
+            try:
+                _nvme_format_ioctl(device_path, ses=1)
+            except (OSError, ImportError) as e:
+                # Only a missing ioctl path falls back; a format the drive rejected is not resent
+                if isinstance(e, OSError) and e.errno not in _NVME_IOCTL_UNSUPPORTED:
+                    raise Exception(f"NVMe crypto erase failed: {e}")
+                logger.info(f"NVMe admin ioctl unavailable for {device_path} ({e}); using nvme-cli")
+                subprocess.run(
+                    ["nvme", "format", device_path, "--ses=1", "--pi=0"],
+                    capture_output=True, text=True, check=True
+                )
             
             if progress_callback:
                 progress_callback(100, "NVMe crypto erase completed")
             
             return {"method": "nvme_crypto_erase", "success": True}
+        except _NvmeStatusError as e:
+            raise Exception(f"NVMe crypto erase failed: {e}")
         except subprocess.CalledProcessError as e:
             raise Exception(f"NVMe crypto erase failed: {e.stderr}")
     
@@ -97,10 +619,49 @@ class WipeMethods:
         # 1. Clear (overwrite with zeros)
         # 2. Verify the clear
         # 3. Purge (crypto erase if available, otherwise additional overwrite)
+        # On flash, discard and crypto/sanitize erase are the primitives the device
+        # actually honours, so SSD/NVMe skip the full-device zero pass entirely.
         
         if progress_callback:
             progress_callback(0, "Starting NIST 800-88 wipe...")
         
+        # Detect device type best-effort
+        device_type = self._detect_device_type_best_effort(device_path)
+        
+        if device_type in ("ssd", "nvme"):
+            # Step 1: Clear by discarding every block
+            if progress_callback:
+                progress_callback(10, "Discarding all blocks (TRIM)...")
+            discarded = self._blkdiscard(device_path) or self._try_discard(device_path)
+            
+            # Step 2: Purge
+            if progress_callback:
+                progress_callback(40, "Purging device (crypto erase)...")
+            purge = None
+            try:
+                result = self.crypto_erase(device_path, device_type, None)
+                if result and result.get("success"):
+                    purge = "crypto erase"
+            except Exception as e:
+                logger.warning(f"Crypto erase unavailable: {e}")
+            if purge is None and discarded:
+                purge = "discard"
+            
+            # Step 3: Verify; the overwrite is skipped only when discard or crypto erase
+            # actually succeeded and the device reads back zeros (sampled regions alone
+            # prove nothing if neither ran)
+            if progress_callback:
+                progress_callback(70, "Verifying clear operation...")
+            if purge is None or not self._verify_zeroed(device_path):
+                purge = "overwrite"
+                self._secure_overwrite(device_path, 1, progress_callback, offset=70, max_progress=95)
+                if not self._verify_zeroed(device_path):
+                    raise Exception("Clear verification failed")
+            
+            if progress_callback:
+                progress_callback(100, f"NIST 800-88 wipe completed ({purge})")
+            return {"method": "nist_800_88", "success": True}
+        
         # Step 1: Clear
         if progress_callback:
             progress_callback(10, "Clearing device (overwrite with zeros)...")
@@ -115,13 +676,11 @@ class WipeMethods:
         if not self._verify_zeroed(device_path):
             raise Exception("Clear verification failed")
         
-        # Step 3: Purge (prefer sanitize/crypto erase on SSD/NVMe; fallback overwrite; try discard)
+        # Step 3: Purge (crypto erase if supported; fallback overwrite)
         if progress_callback:
             progress_callback(80, "Purging device...")
         
         try:
-            # Detect device type best-effort
-            device_type = self._detect_device_type_best_effort(device_path)
             # Try crypto/sanitize erase first
             self.crypto_erase(device_path, device_type, None)
             if progress_callback:
@@ -129,14 +688,6 @@ class WipeMethods:
         except:
             # Fallback to additional overwrite
             self._secure_overwrite(device_path, 1, progress_callback, offset=80, max_progress=95)
-            # Best-effort discard/TRIM for SSDs
-            try:
-                if device_type in ("ssd", "nvme"):
-                    if progress_callback:
-                        progress_callback(96, "Attempting discard/TRIM...")
-                    self._try_discard(device_path)
-            except Exception:
-                pass
             if progress_callback:
                 progress_callback(100, "NIST 800-88 wipe completed (overwrite)")
         
@@ -148,6 +699,10 @@ class WipeMethods:
             if self.is_linux:
                 if "nvme" in device_path:
                     return "nvme"
+                # sysfs is a single small read; lsblk (a fork + exec) is only the fallback
+                rotational = _sysfs_rotational(device_path)
+                if rotational is not None:
+                    return "hdd" if rotational else "ssd"
                 out = subprocess.run(["lsblk", "-d", "-o", "ROTA", device_path], capture_output=True, text=True)
                 if out.returncode == 0:
                     lines = (out.stdout or "").strip().splitlines()
@@ -168,12 +723,31 @@ class WipeMethods:
             pass
         return "unknown"
 
-    def _try_discard(self, device_path: str) -> None:
-        """Best-effort discard/trim to inform SSD/NVMe the blocks are unused."""
+    def _blkdiscard(self, device_path: str) -> bool:
+        """Discard the whole device with the BLKDISCARD ioctl (Linux only); True on success."""
+        if not self.is_linux:
+            return False
+        try:
+            import fcntl, struct
+            fd = os.open(device_path, os.O_WRONLY)
+            try:
+                size = _target_size(fd)
+                if not size:
+                    return False
+                fcntl.ioctl(fd, _BLKDISCARD, struct.pack("QQ", 0, size))
+                return True
+            finally:
+                os.close(fd)
+        except OSError as e:
+            logger.info(f"BLKDISCARD not available for {device_path}: {e}")
+            return False
+    
+    def _try_discard(self, device_path: str) -> bool:
+        """Best-effort discard/trim to inform SSD/NVMe the blocks are unused; True only if it ran successfully."""
         try:
             if self.is_linux:
                 # blkdiscard may require exclusive access
-                subprocess.run(["blkdiscard", "-f", device_path], check=False)
+                return subprocess.run(["blkdiscard", "-f", device_path], check=False).returncode == 0
             elif self.is_macos:
                 # macOS performs TRIM internally on erase; no direct tool commonly available
                 pass
@@ -183,6 +757,7 @@ class WipeMethods:
         except Exception:
             # best-effort only
             pass
+        return False
     
     def dod_5220_22_m_wipe(self, device_path: str, passes: int, 
                           progress_callback: Optional[Callable] = None) -> Dict[str, Any]:
@@ -200,12 +775,11 @@ class WipeMethods:
             (None, "Writing random data (Pass 3/3)...")
         ]
         
-        for i, (pattern, message) in enumerate(patterns):
-            if progress_callback:
-                progress_callback(i * 33, message)
-            
-            self._write_pattern(device_path, pattern, progress_callback, 
-                              offset=i * 33, max_progress=(i + 1) * 33)
+        if not self._multi_pattern_stream(device_path, [pattern for pattern, _ in patterns],
+                                          progress_callback, "Writing zeros, ones and random data..."):
+            self._run_passes(device_path, [(pattern, message, i * 33, (i + 1) * 33)
+                                           for i, (pattern, message) in enumerate(patterns)],
+                             progress_callback)
         
         if progress_callback:
             progress_callback(100, "DoD 5220.22-M wipe completed")
@@ -216,26 +790,14 @@ class WipeMethods:
         """Gutmann 35-pass wipe"""
         logger.info("Performing Gutmann 35-pass wipe")
         
-        # Gutmann patterns for maximum security
-        patterns = [
-            b'\x55', b'\xAA', b'\x92\x49\x24', b'\x49\x24\x92',
-            b'\x24\x92\x49', b'\x00', b'\x11', b'\x22', b'\x33',
-            b'\x44', b'\x55', b'\x66', b'\x77', b'\x88', b'\x99',
-            b'\xAA', b'\xBB', b'\xCC', b'\xDD', b'\xEE', b'\xFF',
-            b'\x92\x49\x24\x49', b'\x49\x24\x92\x24', b'\x24\x92\x49\x92',
-            b'\x6D\xB6\xDB\x6D', b'\xB6\xDB\x6D\xB6', b'\xDB\x6D\xB6\xDB',
-            b'\x00', b'\x11', b'\x22', b'\x33', b'\x44', b'\x55',
-            b'\x66', b'\x77', b'\x88', b'\x99', b'\xAA', b'\xBB',
-            b'\xCC', b'\xDD', b'\xEE', b'\xFF'
-        ]
+        patterns = list(_GUTMANN_PATTERNS)
         
-        for i, pattern in enumerate(patterns):
-            if progress_callback:
-                progress_callback(i * 100 // len(patterns), f"Gutmann pass {i+1}/{len(patterns)}...")
-            
-            self._write_pattern(device_path, pattern, None, 
-                              offset=i * 100 // len(patterns), 
-                              max_progress=(i + 1) * 100 // len(patterns))
+        if not self._multi_pattern_stream(device_path, patterns, progress_callback,
+                                          f"Gutmann: writing {len(patterns)} patterns per block..."):
+            self._run_passes(device_path, [(pattern, f"Gutmann pass {i+1}/{len(patterns)}...",
+                                            i * 100 // len(patterns), (i + 1) * 100 // len(patterns))
+                                           for i, pattern in enumerate(patterns)],
+                             progress_callback, report_within_pass=False)
         
         if progress_callback:
             progress_callback(100, "Gutmann wipe completed")
@@ -266,12 +828,11 @@ class WipeMethods:
             (None, "Pass 3/3: Writing random data...")
         ]
         
-        for i, (pattern, message) in enumerate(patterns):
-            if progress_callback:
-                progress_callback(i * 33, message)
-            
-            self._write_pattern(device_path, pattern, progress_callback,
-                              offset=i * 33, max_progress=(i + 1) * 33)
+        if not self._multi_pattern_stream(device_path, [pattern for pattern, _ in patterns],
+                                          progress_callback, "Writing zeros, ones and random data..."):
+            self._run_passes(device_path, [(pattern, message, i * 33, (i + 1) * 33)
+                                           for i, (pattern, message) in enumerate(patterns)],
+                             progress_callback)
         
         if progress_callback:
             progress_callback(100, "Three pass wipe completed")
@@ -287,26 +848,26 @@ class WipeMethods:
 
             def _write_pattern_stream(byte_source: Optional[bytes], message: str, offset_pct: int, max_pct: int):
                 processed = 0
-                if progress_callback:
-                    progress_callback(offset_pct, message)
-                with open(file_path, 'r+b') as f:
-                    while processed < file_size:
-                        to_write = min(chunk_size, file_size - processed)
-                        if byte_source is None:
-                            data = os.urandom(to_write)
-                        else:
-                            if len(byte_source) == 1:
-                                data = byte_source * to_write
-                            else:
-                                repeats = to_write // len(byte_source) + 1
-                                data = (byte_source * repeats)[:to_write]
-                        f.write(data)
-                        f.flush()
-                        os.fsync(f.fileno())
-                        processed += to_write
-                        if progress_callback and file_size > 0:
-                            pct = offset_pct + int((processed / file_size) * (max_pct - offset_pct))
-                            progress_callback(min(pct, max_pct), message)
+                report = _throttled_progress(progress_callback)
+                report(offset_pct, message, force=True)
+                fill = _make_filler(byte_source, min(chunk_size, file_size))
+                # Pattern chunks are views of one immutable tile, so several can go out in a
+                # single writev; random chunks reuse one buffer and must be written one at a time
+                batch = _WRITEV_BATCH if byte_source is not None and hasattr(os, "writev") else 1
+                os.lseek(fd, 0, os.SEEK_SET)
+                while processed < file_size:
+                    remaining = file_size - processed
+                    if batch > 1:
+                        iov = [fill(min(chunk_size, remaining - i * chunk_size))
+                               for i in range(min(batch, -(-remaining // chunk_size)))]
+                        processed += os.writev(fd, iov)
+                    else:
+                        processed += os.write(fd, fill(min(chunk_size, remaining)))
+                    pct = offset_pct + int((processed / file_size) * (max_pct - offset_pct))
+                    report(min(pct, max_pct), message, force=processed >= file_size)
+                # One barrier per pass; once on disk, let the kernel drop the now-clean pages
+                _fdatasync(fd)
+                _fadvise(fd, "POSIX_FADV_DONTNEED")
 
             # Passes: zeros, ones, random (based on requested passes)
             patterns = []
@@ -320,16 +881,20 @@ class WipeMethods:
             if not patterns:
                 patterns = [(b'\x00', "Writing zeros...", 0, 99)]
 
-            for byte_source, message, start_pct, end_pct in patterns:
-                _write_pattern_stream(byte_source, message, start_pct, end_pct)
+            # One descriptor for every pass plus the final truncate
+            fd = os.open(file_path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+            try:
+                _fadvise(fd, "POSIX_FADV_SEQUENTIAL")
+                for byte_source, message, start_pct, end_pct in patterns:
+                    _write_pattern_stream(byte_source, message, start_pct, end_pct)
 
-            # Truncate and delete
-            if progress_callback:
-                progress_callback(99, "Truncating and deleting file...")
-            with open(file_path, 'r+b') as f:
-                f.truncate(0)
-                f.flush()
-                os.fsync(f.fileno())
+                # Truncate and delete
+                if progress_callback:
+                    progress_callback(99, "Truncating and deleting file...")
+                os.ftruncate(fd, 0)
+                _fdatasync(fd)
+            finally:
+                os.close(fd)
             os.remove(file_path)
 
             if progress_callback:
@@ -345,14 +910,17 @@ class WipeMethods:
         """Secure overwrite by streaming zeros across the entire target."""
         try:
             import ctypes, re
-            chunk_size = 16 * 1024 * 1024
-            zero_chunk = b"\x00" * chunk_size
+            chunk_size = _CHUNK_SIZE
+            zero_chunk = _ZERO_CHUNK
+            report = _throttled_progress(progress_callback)
+            # NVMe has deep hardware queues; keep many writes outstanding instead of one
+            queued = not self.is_windows and \
+                self._detect_device_type_best_effort(device_path) == "nvme"
             for pass_num in range(passes):
-                if progress_callback:
-                    progress_callback(
-                        offset + (pass_num * (max_progress - offset) // passes),
-                        f"Overwrite pass {pass_num + 1}/{passes}..."
-                    )
+                message = f"Overwrite pass {pass_num + 1}/{passes}..."
+                pass_start = offset + (pass_num * (max_progress - offset) // passes)
+                pass_span = (max_progress - offset) // passes
+                report(pass_start, message, force=True)
                 if self.is_windows:
                     lower_path = device_path.lower()
                     is_physical = 'physicaldrive' in lower_path
@@ -368,40 +936,98 @@ class WipeMethods:
                         if not m:
                             raise Exception("Unable to parse Windows PhysicalDrive number.")
                         disk_number = m.group(1)
-                        script = f"select disk {disk_number}\nclean all\n"
-                        subprocess.run([
-                            "powershell", "-NoProfile", "-Command",
-                            f"$tmp=[System.IO.Path]::GetTempFileName(); Set-Content -Path $tmp -Value @'\n{script}\n'@; diskpart /s $tmp | Out-Null; Remove-Item $tmp -Force"
-                        ], check=True)
+                        # One line for the persistent session; `r`n separates the DiskPart commands
+                        script = f"select disk {disk_number}`r`nclean all"
+                        self._powershell.run(
+                            f"$tmp=[System.IO.Path]::GetTempFileName(); Set-Content -Path $tmp -Value \"{script}\"; "
+                            f"diskpart /s $tmp | Out-Null; $code=$LASTEXITCODE; Remove-Item $tmp -Force; $LASTEXITCODE=$code"
+                        )
                     else:
                         # Reject drive-letter/volume path to avoid partial clearing
                         raise Exception("On Windows, provide \\ \\.\\PhysicalDriveN for full-device secure wipe.")
                 else:
-                    # POSIX: stream zeros until EOF
-                    with open(device_path, 'wb', buffering=0) as f:
-                        while True:
+                    # POSIX: stream zeros to the end of the target (until ENOSPC if its size is unknown)
+                    fd = _open_direct(device_path)
+                    zero_src = _open_zero_source()
+                    try:
+                        size = _target_size(fd)
+                        if size and pass_num == 0:
+                            _overwrite_priority_blocks(fd, size, zero_chunk)
+                        if size and queued:
+                            _overwrite_queued(fd, size, zero_chunk,
+                                              lambda done: report(pass_start + done * pass_span // size, message))
+                            _fdatasync(fd)
+                            continue
+                        processed = 0
+                        while size is None or processed < size:
+                            to_write = chunk_size if size is None else min(chunk_size, size - processed)
                             try:
-                                written = f.write(zero_chunk)
-                                if not written:
-                                    break
-                                f.flush()
-                                os.fsync(f.fileno())
+                                written = _direct_write(fd, zero_chunk, to_write, zero_src)
                             except OSError:
                                 break
+                            if not written:
+                                break
+                            processed += written
+                            if size:
+                                report(pass_start + processed * pass_span // size, message)
+                        # Single barrier per pass instead of one per chunk
+                        _fdatasync(fd)
+                    finally:
+                        if zero_src is not None:
+                            os.close(zero_src)
+                        os.close(fd)
         except subprocess.CalledProcessError as e:
             raise Exception(f"Secure overwrite failed: {e}")
     
+    def _run_passes(self, device_path: str, passes: list,
+                    progress_callback: Optional[Callable] = None,
+                    report_within_pass: bool = True) -> None:
+        """Run ``(pattern, message, start_pct, end_pct)`` passes back to back.
+
+        This is the path for Windows and for targets ``_multi_pattern_stream`` declines
+        (unknown size, or no O_DIRECT so passes would only overwrite each other in the
+        page cache); each pass gets its own barrier there.
+
+        The next pass's pattern tile is built on a background thread while the
+        current pass is writing, so pass boundaries don't stall on buffer setup.
+        """
+        def build(pattern: Optional[bytes]) -> Optional[bytes]:
+            return self._cached_tile(pattern) if pattern is not None else None
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            next_tile = pool.submit(build, passes[0][0])
+            for i, (pattern, message, start_pct, end_pct) in enumerate(passes):
+                tile = next_tile.result()
+                if i + 1 < len(passes):
+                    next_tile = pool.submit(build, passes[i + 1][0])
+                if progress_callback:
+                    progress_callback(start_pct, message)
+                self._write_pattern(device_path, pattern,
+                                    progress_callback if report_within_pass else None,
+                                    offset=start_pct, max_progress=end_pct, tile=tile)
+    
+    def _cached_tile(self, pattern: bytes) -> bytes:
+        """``_CHUNK_SIZE`` tile of ``pattern``, reused across passes and calls."""
+        tile = self._pattern_cache.get(pattern)
+        if tile is None:
+            tile = _pattern_tile(pattern, _CHUNK_SIZE)
+            if len(self._pattern_cache) >= _PATTERN_CACHE_LIMIT:
+                self._pattern_cache.pop(next(iter(self._pattern_cache)))
+            self._pattern_cache[pattern] = tile
+        return tile
+
     def _write_pattern(self, device_path: str, pattern: Optional[bytes], 
                       progress_callback: Optional[Callable] = None,
-                      offset: int = 0, max_progress: int = 100) -> None:
-        """Write a specific pattern to device"""
+                      offset: int = 0, max_progress: int = 100,
+                      tile: Optional[bytes] = None) -> None:
+        """Write a specific pattern to device (``tile`` is an optional prebuilt chunk of it)"""
         try:
             if pattern is None:
                 # Random data
                 self._write_random_data(device_path, progress_callback, offset, max_progress)
             else:
                 # Specific pattern
-                self._write_specific_pattern(device_path, pattern, progress_callback, offset, max_progress)
+                self._write_specific_pattern(device_path, pattern, progress_callback, offset, max_progress, tile)
         except Exception as e:
             raise Exception(f"Pattern write failed: {e}")
     
@@ -409,98 +1035,212 @@ class WipeMethods:
                           offset: int = 0, max_progress: int = 100) -> None:
         """Write random data across the entire target by streaming chunks."""
         try:
-            chunk_size = 16 * 1024 * 1024
+            chunk_size = _CHUNK_SIZE
             if self.is_windows:
-                device_path_escaped = device_path.replace('\\', '\\\\')
-                cmd = (
-                    "$fs = [System.IO.File]::Open('{path}', [System.IO.FileMode]::OpenOrCreate, [System.IO.FileAccess]::ReadWrite)\n"
-                    "$rng = [System.Security.Cryptography.RandomNumberGenerator]::Create()\n"
-                    "$buffer = New-Object byte[] {size}\n"
-                    "while ($true) {{\n"
-                    "  $rng.GetBytes($buffer)\n"
-                    "  try {{ $fs.Write($buffer, 0, $buffer.Length) }} catch {{ break }}\n"
-                    "  $fs.Flush(); $fs.Flush(true)\n"
-                    "}}\n"
-                    "$fs.Close()\n"
-                ).format(path=device_path_escaped, size=chunk_size)
-                subprocess.run(["powershell", "-NoProfile", "-Command", cmd], check=True)
+                # Native WriteFile loop; the keystream is regenerated in place for every chunk
+                keystream = _new_keystream()
+                zeros = memoryview(bytes(chunk_size))
+                buf = mmap.mmap(-1, chunk_size)
+                out = memoryview(buf)
+                _win_write_stream(device_path, buf,
+                                  lambda n: keystream.update_into(zeros[:n], out[:n]))
+                out.release()
             else:
-                with open(device_path, 'wb', buffering=0) as f:
-                    while True:
-                        data = os.urandom(chunk_size)
-                        try:
-                            written = f.write(data)
+                # Double-buffered: the next chunk of keystream is generated on a worker thread
+                # while the current one is written (os.write releases the GIL), so the pass
+                # runs at the slower of the RNG and the disk rather than their sum.
+                # Size-bounded when known, else until ENOSPC.
+                keystream = _new_keystream()
+                zeros = _ZERO_CHUNK
+                slots = [memoryview(bytearray(chunk_size)) for _ in range(2)]
+
+                def produce(slot: int) -> None:
+                    keystream.update_into(zeros, slots[slot])
+
+                report = _throttled_progress(progress_callback)
+                fd = os.open(device_path, os.O_WRONLY)
+                try:
+                    size = _target_size(fd)
+                    processed = 0
+                    slot = 0
+                    with ThreadPoolExecutor(max_workers=1) as pool:
+                        pending = pool.submit(produce, slot)
+                        while size is None or processed < size:
+                            to_write = chunk_size if size is None else min(chunk_size, size - processed)
+                            pending.result()
+                            pending = pool.submit(produce, slot ^ 1)
+                            try:
+                                written = os.write(fd, slots[slot][:to_write])
+                            except OSError:
+                                break
                             if not written:
                                 break
-                            f.flush()
-                            os.fsync(f.fileno())
-                        except OSError:
-                            break
+                            processed += written
+                            slot ^= 1
+                            if size:
+                                report(offset + processed * (max_progress - offset) // size,
+                                       "Writing random data...")
+                    _fdatasync(fd)
+                finally:
+                    os.close(fd)
         except subprocess.CalledProcessError as e:
             raise Exception(f"Random data write failed: {e}")
     
     def _write_specific_pattern(self, device_path: str, pattern: bytes,
                                progress_callback: Optional[Callable] = None,
-                               offset: int = 0, max_progress: int = 100) -> None:
+                               offset: int = 0, max_progress: int = 100,
+                               tile: Optional[bytes] = None) -> None:
         """Write specific pattern across the entire target by streaming repeated buffers."""
         try:
-            chunk_size = 16 * 1024 * 1024
+            chunk_size = _CHUNK_SIZE
             if len(pattern) == 0:
                 raise Exception("Pattern must be non-empty")
-            repeats = (chunk_size // len(pattern)) + 1
-            chunk = (pattern * repeats)[:chunk_size]
             if self.is_windows:
-                device_path_escaped = device_path.replace('\\', '\\\\')
-                pattern_hex = chunk.hex()
-                cmd = (
-                    "$fs = [System.IO.File]::Open('{path}', [System.IO.FileMode]::OpenOrCreate, [System.IO.FileAccess]::ReadWrite)\n"
-                    "$buffer = [System.Convert]::FromHexString('{hex}')\n"
-                    "while ($true) {{\n"
-                    "  try {{ $fs.Write($buffer, 0, $buffer.Length) }} catch {{ break }}\n"
-                    "  $fs.Flush(); $fs.Flush(true)\n"
-                    "}}\n"
-                    "$fs.Close()\n"
-                ).format(path=device_path_escaped, hex=pattern_hex)
-                subprocess.run(["powershell", "-NoProfile", "-Command", cmd], check=True)
+                # Fill a page-aligned buffer in place and stream it with WriteFile
+                buf = mmap.mmap(-1, chunk_size)
+                if tile is not None:
+                    buf[:] = tile
+                else:
+                    _fill_tile(buf, pattern)
+                _win_write_stream(device_path, buf)
             else:
-                with open(device_path, 'wb', buffering=0) as f:
-                    while True:
+                chunk = tile if tile is not None else self._cached_tile(pattern)
+                # Write the tile straight to the target; size-bounded when known, else until ENOSPC.
+                # On Linux the tile lives in a memfd and is moved with sendfile, so no chunk is
+                # copied through userspace; os.write is the fallback if the kernel refuses.
+                view = memoryview(chunk)
+                src = _tile_memfd(chunk) if self.is_linux else None
+                report = _throttled_progress(progress_callback)
+                fd = os.open(device_path, os.O_WRONLY)
+                try:
+                    size = _target_size(fd)
+                    processed = 0
+                    while size is None or processed < size:
+                        tile_offset = processed % chunk_size
+                        to_write = chunk_size - tile_offset
+                        if size is not None:
+                            to_write = min(to_write, size - processed)
                         try:
-                            written = f.write(chunk)
-                            if not written:
-                                break
-                            f.flush()
-                            os.fsync(f.fileno())
-                        except OSError:
+                            if src is not None:
+                                written = os.sendfile(fd, src, tile_offset, to_write)
+                            else:
+                                written = os.write(fd, view[tile_offset:tile_offset + to_write])
+                        except OSError as e:
+                            if src is not None and e.errno in (errno.EINVAL, errno.ENOSYS):
+                                os.close(src)
+                                src = None
+                                continue
+                            break
+                        if not written:
                             break
+                        processed += written
+                        if size:
+                            report(offset + processed * (max_progress - offset) // size,
+                                   f"Writing pattern 0x{pattern.hex().upper()}...")
+                    # One barrier per pass; syncing every chunk only serialises the queue
+                    _fdatasync(fd)
+                finally:
+                    if src is not None:
+                        os.close(src)
+                    os.close(fd)
         except subprocess.CalledProcessError as e:
             raise Exception(f"Pattern write failed: {e}")
     
+    def _multi_pattern_stream(self, device_path: str, patterns: list,
+                              progress_callback: Optional[Callable] = None,
+                              message: str = "Writing patterns...") -> bool:
+        """Fused multi-pass overwrite: every pattern is written over one block before moving on.
+
+        Only used with O_DIRECT, where each write goes to the device rather than the page
+        cache, so every pass reaches the device without a flush per pattern; one barrier
+        at the end makes the result durable. Returns False (nothing written) on Windows,
+        when the target size is unknown or when O_DIRECT is refused, so the caller can
+        fall back to whole-device passes.
+        """
+        if self.is_windows:
+            return False
+        try:
+            fd = _open_direct(device_path)
+        except OSError as e:
+            raise Exception(f"Multi-pattern write failed: {e}")
+        try:
+            size = _target_size(fd)
+            if not size or not _is_direct(fd):
+                return False
+            report = _throttled_progress(progress_callback)
+            buf = mmap.mmap(-1, _CHUNK_SIZE)
+            view = memoryview(buf)
+            zeros = _ZERO_CHUNK
+            keystreams = {i: _new_keystream() for i, p in enumerate(patterns) if p is None}
+            pos = 0
+            try:
+                while pos < size:
+                    to_write = min(_CHUNK_SIZE, size - pos)
+                    for i, pattern in enumerate(patterns):
+                        if pattern is None:
+                            keystreams[i].update_into(zeros[:to_write], view[:to_write])
+                        else:
+                            # Rotate so multi-byte patterns stay continuous across block boundaries
+                            phase = pos % len(pattern)
+                            _fill_tile(buf, pattern[phase:] + pattern[:phase])
+                        os.lseek(fd, pos, os.SEEK_SET)
+                        written = _direct_write(fd, view, to_write)
+                        if not _is_direct(fd):
+                            # An unaligned tail leaves O_DIRECT; flush before the next pattern lands in the cache
+                            _fdatasync(fd)
+                    if not written:
+                        raise OSError(errno.ENOSPC, f"short write at offset {pos}")
+                    pos += written
+                    report(pos * 100 // size, message)
+                _fdatasync(fd)
+            except OSError as e:
+                raise Exception(f"Multi-pattern write failed: {e}")
+            finally:
+                view.release()
+                buf.close()
+            return True
+        finally:
+            os.close(fd)
+
     def _verify_zeroed(self, device_path: str) -> bool:
         """Verify multiple sampled regions are zeroed (head, middle, tail)."""
         try:
-            sample_size = 1024 * 1024
+            sample_size = _VERIFY_SAMPLE_SIZE
             file_size = None
             try:
-                file_size = os.path.getsize(device_path)
+                # Seek to the end rather than stat so block devices report their real size
+                fd = os.open(device_path, os.O_RDONLY)
+                try:
+                    file_size = _target_size(fd)
+                finally:
+                    os.close(fd)
             except Exception:
                 file_size = None
             def _check_region(offset_bytes: int) -> bool:
+                # Each region gets its own handle and buffer so the reads can run concurrently
+                buf = bytearray(sample_size)
                 try:
-                    with open(device_path, 'rb') as f:
+                    with io.FileIO(device_path, 'r') as f:
                         if offset_bytes > 0:
                             f.seek(offset_bytes)
-                        data = f.read(sample_size)
-                        if not data:
-                            return True
-                        return all(b == 0 for b in data)
+                        n = f.readinto(buf)
+                    # bytearray == bytes is one memcmp (~17 us/MiB); memoryview equality, any()
+                    # over a cast('Q') view and OR-folding words (struct.iter_unpack or
+                    # int.from_bytes) all run 40-500x slower
+                    if n == sample_size:
+                        return buf == _ZERO_SAMPLE
+                    return buf[:n] == _ZERO_SAMPLE[:n]
                 except Exception:
                     return False
             offsets = [0]
             if file_size and file_size > sample_size * 2:
                 offsets.append(max(0, file_size // 2))
                 offsets.append(max(0, file_size - sample_size))
-            return all(_check_region(o) for o in offsets)
+            if len(offsets) == 1:
+                return _check_region(0)
+            # Region reads are independent and latency-bound (seeks on HDDs), so overlap them
+            with ThreadPoolExecutor(max_workers=len(offsets)) as pool:
+                return all(pool.map(_check_region, offsets))
         except Exception as e:
             logger.error(f"Verification failed: {e}")
             return False
@@ -519,8 +1259,10 @@ class WipeMethods:
             if progress_callback:
                 progress_callback(50, "ATA sanitize in progress...")
             
-            # Wait for completion
+            # Wait for completion; sanitize can run for hours, so back off between status polls
+            delay = _SANITIZE_POLL_MIN
             while True:
+                time.sleep(delay)
                 result = subprocess.run([
                     "hdparm", "--sanitize-status", device_path
                 ], capture_output=True, text=True, check=True)
@@ -530,7 +1272,7 @@ class WipeMethods:
                 elif "Sanitize failed" in result.stdout:
                     raise Exception("ATA sanitize failed")
                 
-                time.sleep(1)
+                delay = min(delay * 2, _SANITIZE_POLL_MAX)
             
             if progress_callback:
                 progress_callback(100, "ATA sanitize completed")
@@ -545,13 +1287,19 @@ class WipeMethods:
             if progress_callback:
                 progress_callback(0, "Starting NVMe format...")
             
-            subprocess.run([
-                "nvme", "format", device_path, "--ses=1"
-            ], check=True)
+            try:
+                _nvme_format_ioctl(device_path, ses=1)
+            except (OSError, ImportError) as e:
+                if isinstance(e, OSError) and e.errno not in _NVME_IOCTL_UNSUPPORTED:
+                    raise Exception(f"NVMe format failed: {e}")
+                logger.info(f"NVMe admin ioctl unavailable for {device_path} ({e}); using nvme-cli")
+                subprocess.run([
+                    "nvme", "format", device_path, "--ses=1"
+                ], check=True)
             
             if progress_callback:
                 progress_callback(100, "NVMe format completed")
             
             return {"method": "nvme_format", "success": True}
-        except subprocess.CalledProcessError as e:
+        except (_NvmeStatusError, subprocess.CalledProcessError) as e:
             raise Exception(f"NVMe format failed: {e}")
@@ -3,12 +3,15 @@ Advanced Certificate Generator for ZeroTrace
 Generates tamper-proof PDF and JSON certificates using ReportLab and PyHanko
 """
 
+import io
 import os
 import json
 import hashlib
 import secrets
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
 from reportlab.lib.pagesizes import A4, letter
@@ -19,13 +22,22 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from reportlab.pdfgen import canvas
 from reportlab.lib import colors
+from reportlab.lib.utils import simpleSplit
 
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
 from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from cryptography.hazmat.backends import default_backend
+from cryptography.exceptions import InvalidSignature
+from cryptography import x509
+from cryptography.x509.oid import NameOID
 
 import logging
+try:
+    import orjson  # optional C encoder; stdlib json is the fallback
+except ImportError:
+    orjson = None
 from pyhanko.sign import signers
 from pyhanko_certvalidator.context import ValidationContext
 from pyhanko import stamp
@@ -33,6 +45,127 @@ from pyhanko.pdf_utils.incremental_writer import IncrementalPdfFileWriter
 
 logger = logging.getLogger(__name__)
 
+# hashlib.sha256 is OpenSSL's (SHA-NI, else AVX2) unless Python was built without it
+if getattr(hashlib.sha256, "__name__", "") != "openssl_sha256":
+    logger.warning("hashlib.sha256 is not OpenSSL-backed; certificate hashing uses the builtin fallback")
+
+def _canonical_json(data: Dict[str, Any]) -> bytes:
+    """Compact, key-sorted UTF-8 JSON; the exact bytes stored and signed for JSON certificates"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+# RSA-PSS parameters shared by JSON signing and verification (existing .sig files use these)
+_PSS_PADDING = padding.PSS(
+    mgf=padding.MGF1(hashes.SHA256()),
+    salt_length=padding.PSS.MAX_LENGTH
+)
+
+# ReportLab styles are immutable templates; build them once instead of per certificate
+_TEXT_DARK = HexColor('#2D3748')
+_TEXT_MUTED = HexColor('#4A5568')
+_TEXT_FOOTER = HexColor('#718096')
+_TABLE_LABEL_BG = HexColor('#F7FAFC')
+_TABLE_GRID = HexColor('#E2E8F0')
+
+_STYLES = getSampleStyleSheet()
+
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    alignment=TA_CENTER,
+    textColor=_TEXT_DARK,
+    fontName='Helvetica-Bold'
+)
+
+_SUBTITLE_STYLE = ParagraphStyle(
+    'CustomSubtitle',
+    parent=_STYLES['Heading2'],
+    fontSize=16,
+    spaceAfter=20,
+    alignment=TA_CENTER,
+    textColor=_TEXT_MUTED,
+    fontName='Helvetica'
+)
+
+_HEADER_STYLE = ParagraphStyle(
+    'Header',
+    parent=_STYLES['Heading3'],
+    fontSize=14,
+    spaceAfter=12,
+    textColor=_TEXT_DARK,
+    fontName='Helvetica-Bold'
+)
+
+_NORMAL_STYLE = ParagraphStyle(
+    'Normal',
+    parent=_STYLES['Normal'],
+    fontSize=11,
+    spaceAfter=6,
+    textColor=_TEXT_MUTED,
+    fontName='Helvetica'
+)
+
+_FOOTER_STYLE = ParagraphStyle(
+    'Footer',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    alignment=TA_CENTER,
+    textColor=_TEXT_FOOTER
+)
+
+# Subject/issuer and CA constraint of the self-signed signing certificate
+_CERT_NAME = x509.Name([
+    x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+    x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "California"),
+    x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
+    x509.NameAttribute(NameOID.ORGANIZATION_NAME, "ZeroTrace"),
+    x509.NameAttribute(NameOID.COMMON_NAME, "ZeroTrace Certificate Authority"),
+])
+_CERT_BASIC_CONSTRAINTS = x509.BasicConstraints(ca=True, path_length=None)
+
+# Standards cited per wipe method; every method is reported against NIST 800-88
+_BASE_COMPLIANCE = ("NIST 800-88",)
+_COMPLIANCE_STANDARDS = {
+    'dod_5220_22_m': _BASE_COMPLIANCE + ("DoD 5220.22-M",),
+    'crypto_erase': _BASE_COMPLIANCE + ("Cryptographic Erasure",),
+    'gutmann': _BASE_COMPLIANCE + ("Gutmann Method",),
+    'ata_sanitize': _BASE_COMPLIANCE + ("ATA Sanitize",),
+    'nvme_format': _BASE_COMPLIANCE + ("NVMe Format",),
+}
+
+_VERIFY_CACHE_LIMIT = 1024
+
+def _file_sha256(filepath: str) -> bytes:
+    """SHA-256 of a file, hashed in chunks rather than read whole"""
+    with open(filepath, 'rb') as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, 'sha256').digest()
+        # hashlib.file_digest is Python 3.11+
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+        return digest.digest()
+
+# Fixed page geometry for the canvas-drawn certificate
+_PDF_MARGIN = 72
+_PDF_BOTTOM = 36
+_PDF_LABEL_WIDTH = 2 * inch
+_PDF_VALUE_WIDTH = 4 * inch
+_PDF_ROW_HEIGHT = 18
+_PDF_QR_SIZE = 1.8 * inch
+
+_LEGAL_NOTICE = (
+    "This certificate serves as proof that the data on the specified device has been "
+    "securely destroyed using industry-standard methods. The destruction process has "
+    "been verified and documented according to NIST 800-88 guidelines. "
+    "This certificate is digitally signed and any tampering will invalidate its authenticity."
+)
+
 class CertificateGenerator:
     """Advanced certificate generator with tamper-proof features"""
     
@@ -42,16 +175,38 @@ class CertificateGenerator:
         self.private_key_path = self.keys_dir / "private.pem"
         self.public_key_path = self.keys_dir / "public.pem"
         self.certificate_path = self.keys_dir / "certificate.pem"
+        # Created once here rather than on every certificate
+        self._reports_dir = Path("reports")
+        self._reports_dir.mkdir(exist_ok=True)
+        self._keys_lock = threading.Lock()
+        # "embedded": PAdES signature inside the PDF plus a .p7s; "detached": the .p7s alone
+        self.sign_mode = os.getenv("ZEROTRACE_SIGN_MODE", "embedded").lower()
+        self._verify_cache: Dict[tuple, Dict[str, Any]] = {}
+        self._verify_cache_lock = threading.Lock()
         
-        # Initialize or load keys
-        self._ensure_keys_exist()
+        # Keys are loaded (or generated, which is slow) off the caller's thread; anything that
+        # needs them blocks in _ensure_keys_exist until this has finished
+        self.private_key = None
+        threading.Thread(target=self._prepare_keys, name="certificate-keys", daemon=True).start()
+    
+    def _prepare_keys(self):
+        """Background key load/generation started at construction"""
+        try:
+            self._ensure_keys_exist()
+        except Exception as e:
+            logger.error(f"Background key preparation failed: {e}")
     
     def _ensure_keys_exist(self):
-        """Ensure cryptographic keys exist, generate if not"""
-        if not self.private_key_path.exists():
-            self._generate_keys()
-        else:
-            self._load_keys()
+        """Ensure cryptographic keys exist and are loaded, generate if not"""
+        if self.private_key is not None:
+            return
+        with self._keys_lock:
+            if self.private_key is not None:
+                return
+            if not self.private_key_path.exists():
+                self._generate_keys()
+            else:
+                self._load_keys()
     
     def _generate_keys(self):
         """Generate RSA key pair for signing"""
@@ -63,50 +218,66 @@ class CertificateGenerator:
                 backend=default_backend()
             )
             
-            # Save private key
-            with open(self.private_key_path, "wb") as f:
-                f.write(private_key.private_bytes(
-                    encoding=serialization.Encoding.PEM,
-                    format=serialization.PrivateFormat.PKCS8,
-                    encryption_algorithm=serialization.NoEncryption()
-                ))
-            
-            # Save public key
             public_key = private_key.public_key()
-            with open(self.public_key_path, "wb") as f:
-                f.write(public_key.public_bytes(
+            
+            # Save certificate, public key, then private key: _ensure_keys_exist treats
+            # private.pem as the marker that the set is complete
+            self._write_key_files([
+                (self.certificate_path, self._generate_self_signed_certificate(private_key, public_key), 0o644),
+                (self.public_key_path, public_key.public_bytes(
                     encoding=serialization.Encoding.PEM,
                     format=serialization.PublicFormat.SubjectPublicKeyInfo
-                ))
-            
-            # Generate self-signed certificate
-            self._generate_self_signed_certificate(private_key, public_key)
+                ), 0o644),
+                (self.private_key_path, private_key.private_bytes(
+                    encoding=serialization.Encoding.PEM,
+                    format=serialization.PrivateFormat.PKCS8,
+                    encryption_algorithm=serialization.NoEncryption()
+                ), 0o600),
+            ])
             
+            self._cache_key_material(private_key)
             logger.info("Generated new cryptographic keys")
             
         except Exception as e:
             logger.error(f"Failed to generate keys: {e}")
             raise
     
-    def _generate_self_signed_certificate(self, private_key, public_key):
-        """Generate a self-signed certificate"""
-        from cryptography import x509
-        from cryptography.x509.oid import NameOID
+    def _write_key_files(self, files):
+        """Write (path, data, mode) entries, syncing each file's data and the keys directory once"""
+        dir_fd = None
+        if hasattr(os, "O_DIRECTORY") and os.open in os.supports_dir_fd:
+            dir_fd = os.open(self.keys_dir, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            for path, data, mode in files:
+                flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+                if dir_fd is not None:
+                    fd = os.open(Path(path).name, flags, mode, dir_fd=dir_fd)
+                else:
+                    fd = os.open(path, flags, mode)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                    if dir_fd is not None:
+                        getattr(os, "fdatasync", os.fsync)(fd)
+                finally:
+                    os.close(fd)
+            if dir_fd is not None:
+                # One directory sync makes all three new entries durable
+                os.fsync(dir_fd)
+        finally:
+            if dir_fd is not None:
+                os.close(dir_fd)
+    
+    def _generate_self_signed_certificate(self, private_key, public_key) -> bytes:
+        """Generate a self-signed certificate, returned as PEM"""
         from datetime import datetime, timedelta
         
         # Create certificate
-        subject = issuer = x509.Name([
-            x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-            x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "California"),
-            x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
-            x509.NameAttribute(NameOID.ORGANIZATION_NAME, "ZeroTrace"),
-            x509.NameAttribute(NameOID.COMMON_NAME, "ZeroTrace Certificate Authority"),
-        ])
-        
         cert = x509.CertificateBuilder().subject_name(
-            subject
+            _CERT_NAME
         ).issuer_name(
-            issuer
+            _CERT_NAME
         ).public_key(
             public_key
         ).serial_number(
@@ -116,216 +287,51 @@ class CertificateGenerator:
         ).not_valid_after(
             datetime.utcnow() + timedelta(days=365)
         ).add_extension(
-            x509.BasicConstraints(ca=True, path_length=None),
+            _CERT_BASIC_CONSTRAINTS,
             critical=True,
         ).sign(private_key, hashes.SHA256(), default_backend())
         
-        # Save certificate
-        with open(self.certificate_path, "wb") as f:
-            f.write(cert.public_bytes(serialization.Encoding.PEM))
+        return cert.public_bytes(serialization.Encoding.PEM)
     
     def _load_keys(self):
         """Load existing keys"""
         try:
             with open(self.private_key_path, "rb") as f:
-                self.private_key = load_pem_private_key(
+                private_key = load_pem_private_key(
                     f.read(), password=None, backend=default_backend()
                 )
+            self._cache_key_material(private_key)
             logger.info("Loaded existing cryptographic keys")
         except Exception as e:
             logger.error(f"Failed to load keys: {e}")
             self._generate_keys()
     
+    def _cache_key_material(self, private_key):
+        """Keep the parsed key pair, public PEM and its fingerprint for reuse across certificates"""
+        self.private_key = private_key
+        self.public_key = private_key.public_key()
+        self._public_key_pem = self.public_key.public_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        self._pubkey_fpr = hashlib.sha256(self._public_key_pem).hexdigest()[:16].upper()
+    
     def generate_pdf_certificate(self, wipe_data: Dict[str, Any]) -> str:
         """Generate tamper-proof PDF certificate"""
         try:
-            # Create reports directory
-            reports_dir = Path("reports")
-            reports_dir.mkdir(exist_ok=True)
+            self._ensure_keys_exist()
             
             # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"zerotrace_certificate_{timestamp}.pdf"
-            filepath = reports_dir / filename
+            filepath = self._report_path(self._reports_dir, "pdf")
             
-            # Create PDF document
-            doc = SimpleDocTemplate(
-                str(filepath),
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
-            
-            # Build content
-            story = []
-            styles = getSampleStyleSheet()
-            
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=TA_CENTER,
-                textColor=HexColor('#2D3748'),
-                fontName='Helvetica-Bold'
-            )
-            
-            subtitle_style = ParagraphStyle(
-                'CustomSubtitle',
-                parent=styles['Heading2'],
-                fontSize=16,
-                spaceAfter=20,
-                alignment=TA_CENTER,
-                textColor=HexColor('#4A5568'),
-                fontName='Helvetica'
-            )
-            
-            header_style = ParagraphStyle(
-                'Header',
-                parent=styles['Heading3'],
-                fontSize=14,
-                spaceAfter=12,
-                textColor=HexColor('#2D3748'),
-                fontName='Helvetica-Bold'
-            )
-            
-            normal_style = ParagraphStyle(
-                'Normal',
-                parent=styles['Normal'],
-                fontSize=11,
-                spaceAfter=6,
-                textColor=HexColor('#4A5568'),
-                fontName='Helvetica'
-            )
-            
-            # Title
-            story.append(Paragraph("🔒 ZEROTRACE CERTIFICATE OF DATA DESTRUCTION", title_style))
-            story.append(Spacer(1, 12))
-            
-            # Subtitle
-            story.append(Paragraph("Tamper-Proof Digital Certificate", subtitle_style))
-            story.append(Spacer(1, 20))
-            
-            # Certificate ID
+            # Draw the certificate in memory; it is written to disk once, after signing
+            pdf_buffer = io.BytesIO()
             cert_id = self._generate_certificate_id(wipe_data)
-            story.append(Paragraph(f"<b>Certificate ID:</b> {cert_id}", normal_style))
-            story.append(Paragraph(f"<b>Issued:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}", normal_style))
-            story.append(Spacer(1, 20))
-            
-            # Device Information
-            story.append(Paragraph("DEVICE INFORMATION", header_style))
-            device_info = [
-                ["Device Path:", wipe_data.get('device_path', 'N/A')],
-                ["Device Type:", wipe_data.get('device_type', 'N/A').upper()],
-                ["Device Model:", wipe_data.get('model', 'N/A')],
-                ["Serial Number:", wipe_data.get('serial', 'N/A')],
-                ["Size:", self._format_size(wipe_data.get('size', 0))]
-            ]
-            
-            device_table = Table(device_info, colWidths=[2*inch, 4*inch])
-            device_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), HexColor('#F7FAFC')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), HexColor('#2D3748')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, HexColor('#E2E8F0'))
-            ]))
-            story.append(device_table)
-            story.append(Spacer(1, 20))
-            
-            # Wipe Information
-            story.append(Paragraph("WIPE OPERATION DETAILS", header_style))
-            wipe_info = [
-                ["Method:", wipe_data.get('method', 'N/A').replace('_', ' ').title()],
-                ["Passes:", str(wipe_data.get('passes', 1))],
-                ["Started:", wipe_data.get('started_at', 'N/A')],
-                ["Completed:", wipe_data.get('completed_at', 'N/A')],
-                ["Duration:", self._format_duration(wipe_data.get('duration_seconds', 0))],
-                ["Status:", wipe_data.get('status', 'N/A').upper()]
-            ]
-            
-            wipe_table = Table(wipe_info, colWidths=[2*inch, 4*inch])
-            wipe_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), HexColor('#F7FAFC')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), HexColor('#2D3748')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, HexColor('#E2E8F0'))
-            ]))
-            story.append(wipe_table)
-            story.append(Spacer(1, 20))
+            issued = datetime.now(timezone.utc)
+            self._build_pdf_fast(pdf_buffer, wipe_data, cert_id, issued)
             
-            # Verification Data
-            story.append(Paragraph("VERIFICATION DATA", header_style))
-            verification_data = [
-                ["SHA-256 Before:", wipe_data.get('sha_before', 'N/A')],
-                ["SHA-256 After:", wipe_data.get('sha_after', 'N/A')],
-                ["Verification:", "✅ DATA SUCCESSFULLY DESTROYED" if wipe_data.get('status') == 'completed' else "❌ WIPE FAILED"]
-            ]
-            
-            verification_table = Table(verification_data, colWidths=[2*inch, 4*inch])
-            verification_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), HexColor('#F7FAFC')),
-                ('TEXTCOLOR', (0, 0), (-1, -1), HexColor('#2D3748')),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('GRID', (0, 0), (-1, -1), 1, HexColor('#E2E8F0'))
-            ]))
-            story.append(verification_table)
-            story.append(Spacer(1, 12))
-
-            # QR Code linking to verification payload (local proof URL or embedded JSON reference)
-            try:
-                qr_payload = self._build_qr_payload(wipe_data)
-                qr_img_path = self._generate_qr_image(qr_payload)
-                story.append(Paragraph("SCAN TO VERIFY", header_style))
-                story.append(Paragraph("QR encodes the certificate ID and hashes for validation.", normal_style))
-                story.append(Spacer(1, 6))
-                story.append(Image(qr_img_path, width=1.8*inch, height=1.8*inch))
-                story.append(Spacer(1, 12))
-            except Exception as e:
-                logger.warning(f"Failed to add QR code: {e}")
-            story.append(Spacer(1, 18))
-            
-            # Digital Signature Section
-            story.append(Paragraph("DIGITAL SIGNATURE", header_style))
-            story.append(Paragraph("This certificate is digitally signed and tamper-proof.", normal_style))
-            story.append(Paragraph(f"<b>Signature Hash:</b> {self._generate_signature_hash(wipe_data)}", normal_style))
-            story.append(Paragraph(f"<b>Public Key Fingerprint:</b> {self._get_public_key_fingerprint()}", normal_style))
-            story.append(Spacer(1, 20))
-            
-            # Legal Notice
-            story.append(Paragraph("LEGAL NOTICE", header_style))
-            legal_text = """
-            This certificate serves as proof that the data on the specified device has been 
-            securely destroyed using industry-standard methods. The destruction process has 
-            been verified and documented according to NIST 800-88 guidelines.
-            
-            This certificate is digitally signed and any tampering will invalidate its authenticity.
-            """
-            story.append(Paragraph(legal_text, normal_style))
-            story.append(Spacer(1, 20))
-            
-            # Footer
-            story.append(Paragraph("Generated by ZeroTrace - Secure Data Wiping Tool", 
-                                 ParagraphStyle('Footer', parent=styles['Normal'], 
-                                              fontSize=9, alignment=TA_CENTER, 
-                                              textColor=HexColor('#718096'))))
-            
-            # Build PDF
-            doc.build(story)
-            
-            # Sign the PDF
-            self._sign_pdf(str(filepath))
+            # Sign the PDF and write it out
+            self._sign_pdf(pdf_buffer, str(filepath))
             
             logger.info(f"Generated PDF certificate: {filepath}")
             return str(filepath)
@@ -334,29 +340,171 @@ class CertificateGenerator:
             logger.error(f"Failed to generate PDF certificate: {e}")
             raise
     
+    def _build_pdf_fast(self, pdf_buffer: io.BytesIO, wipe_data: Dict[str, Any], cert_id: str, issued: datetime):
+        """Draw the certificate straight onto a canvas at fixed positions (no Platypus layout pass)"""
+        c = canvas.Canvas(pdf_buffer, pagesize=A4)
+        page_width, page_height = A4
+        left = _PDF_MARGIN
+        width = page_width - 2 * _PDF_MARGIN
+        y = page_height - _PDF_MARGIN
+        
+        def ensure_space(height):
+            nonlocal y
+            if y - height < _PDF_BOTTOM:
+                c.showPage()
+                y = page_height - _PDF_MARGIN
+        
+        def lines(text, font, size, color, centered=False, space_after=0):
+            nonlocal y
+            c.setFont(font, size)
+            c.setFillColor(color)
+            for line in simpleSplit(text, font, size, width):
+                ensure_space(size * 1.2)
+                y -= size * 1.2
+                if centered:
+                    c.drawCentredString(page_width / 2, y + size * 0.2, line)
+                else:
+                    c.drawString(left, y + size * 0.2, line)
+            y -= space_after
+        
+        def field(label, value):
+            nonlocal y
+            ensure_space(_NORMAL_STYLE.fontSize * 1.2)
+            y -= _NORMAL_STYLE.fontSize * 1.2
+            c.setFillColor(_TEXT_MUTED)
+            c.setFont('Helvetica-Bold', _NORMAL_STYLE.fontSize)
+            c.drawString(left, y + 2, label)
+            c.setFont('Helvetica', _NORMAL_STYLE.fontSize)
+            c.drawString(left + c.stringWidth(label + ' ', 'Helvetica-Bold', _NORMAL_STYLE.fontSize), y + 2, value)
+            y -= _NORMAL_STYLE.spaceAfter
+        
+        def header(text):
+            lines(text, 'Helvetica-Bold', _HEADER_STYLE.fontSize, _TEXT_DARK, space_after=_HEADER_STYLE.spaceAfter)
+        
+        def table(rows):
+            nonlocal y
+            ensure_space(_PDF_ROW_HEIGHT * len(rows))
+            top = y
+            bottom = y - _PDF_ROW_HEIGHT * len(rows)
+            c.setFillColor(_TABLE_LABEL_BG)
+            c.rect(left, bottom, _PDF_LABEL_WIDTH, top - bottom, stroke=0, fill=1)
+            c.setStrokeColor(_TABLE_GRID)
+            c.setLineWidth(1)
+            c.rect(left, bottom, _PDF_LABEL_WIDTH + _PDF_VALUE_WIDTH, top - bottom, stroke=1, fill=0)
+            c.line(left + _PDF_LABEL_WIDTH, bottom, left + _PDF_LABEL_WIDTH, top)
+            c.setFillColor(_TEXT_DARK)
+            c.setFont('Helvetica', 10)
+            for label, value in rows:
+                y -= _PDF_ROW_HEIGHT
+                if y > bottom:
+                    c.line(left, y, left + _PDF_LABEL_WIDTH + _PDF_VALUE_WIDTH, y)
+                c.drawString(left + 6, y + 6, label)
+                # Platypus rendered missing values (e.g. no sha_after for file wipes) as empty cells
+                c.drawString(left + _PDF_LABEL_WIDTH + 6, y + 6, "" if value is None else str(value))
+        
+        # Title
+        lines("🔒 ZEROTRACE CERTIFICATE OF DATA DESTRUCTION", 'Helvetica-Bold', _TITLE_STYLE.fontSize,
+              _TEXT_DARK, centered=True, space_after=_TITLE_STYLE.spaceAfter + 12)
+        
+        # Subtitle
+        lines("Tamper-Proof Digital Certificate", 'Helvetica', _SUBTITLE_STYLE.fontSize,
+              _TEXT_MUTED, centered=True, space_after=_SUBTITLE_STYLE.spaceAfter + 20)
+        
+        # Certificate ID
+        field("Certificate ID:", cert_id)
+        field("Issued:", issued.strftime('%Y-%m-%d %H:%M:%S UTC'))
+        y -= 20
+        
+        # Device Information
+        header("DEVICE INFORMATION")
+        table([
+            ["Device Path:", wipe_data.get('device_path', 'N/A')],
+            ["Device Type:", wipe_data.get('device_type', 'N/A').upper()],
+            ["Device Model:", wipe_data.get('model', 'N/A')],
+            ["Serial Number:", wipe_data.get('serial', 'N/A')],
+            ["Size:", self._format_size(wipe_data.get('size', 0))]
+        ])
+        y -= 20
+        
+        # Wipe Information
+        header("WIPE OPERATION DETAILS")
+        table([
+            ["Method:", wipe_data.get('method', 'N/A').replace('_', ' ').title()],
+            ["Passes:", str(wipe_data.get('passes', 1))],
+            ["Started:", wipe_data.get('started_at', 'N/A')],
+            ["Completed:", wipe_data.get('completed_at', 'N/A')],
+            ["Duration:", self._format_duration(wipe_data.get('duration_seconds', 0))],
+            ["Status:", wipe_data.get('status', 'N/A').upper()]
+        ])
+        y -= 20
+        
+        # Verification Data
+        header("VERIFICATION DATA")
+        table([
+            ["SHA-256 Before:", wipe_data.get('sha_before', 'N/A')],
+            ["SHA-256 After:", wipe_data.get('sha_after', 'N/A')],
+            ["Verification:", "✅ DATA SUCCESSFULLY DESTROYED" if wipe_data.get('status') == 'completed' else "❌ WIPE FAILED"]
+        ])
+        y -= 12
+        
+        # QR Code linking to verification payload (local proof URL or embedded JSON reference)
+        try:
+            qr_img_path = self._generate_qr_image(self._build_qr_payload(wipe_data, cert_id, issued))
+            ensure_space(_HEADER_STYLE.fontSize * 1.2 + _HEADER_STYLE.spaceAfter + 30 + _PDF_QR_SIZE)
+            header("SCAN TO VERIFY")
+            lines("QR encodes the certificate ID and hashes for validation.", 'Helvetica',
+                  _NORMAL_STYLE.fontSize, _TEXT_MUTED, space_after=_NORMAL_STYLE.spaceAfter + 6)
+            y -= _PDF_QR_SIZE
+            c.drawImage(qr_img_path, left + (width - _PDF_QR_SIZE) / 2, y, _PDF_QR_SIZE, _PDF_QR_SIZE)
+            y -= 12
+        except Exception as e:
+            logger.warning(f"Failed to add QR code: {e}")
+        y -= 18
+        
+        # Digital Signature Section
+        header("DIGITAL SIGNATURE")
+        lines("This certificate is digitally signed and tamper-proof.", 'Helvetica',
+              _NORMAL_STYLE.fontSize, _TEXT_MUTED, space_after=_NORMAL_STYLE.spaceAfter)
+        field("Signature Hash:", self._generate_signature_hash(wipe_data))
+        field("Public Key Fingerprint:", self._get_public_key_fingerprint())
+        y -= 20
+        
+        # Legal Notice
+        header("LEGAL NOTICE")
+        lines(_LEGAL_NOTICE, 'Helvetica', _NORMAL_STYLE.fontSize, _TEXT_MUTED, space_after=_NORMAL_STYLE.spaceAfter + 20)
+        
+        # Footer
+        lines("Generated by ZeroTrace - Secure Data Wiping Tool", 'Helvetica', _FOOTER_STYLE.fontSize,
+              _TEXT_FOOTER, centered=True)
+        
+        c.showPage()
+        c.save()
+    
+    def generate_pdf_certificates(self, wipe_data_list: List[Dict[str, Any]]) -> List[str]:
+        """Generate signed PDF certificates for several wipes, reusing one loaded signer"""
+        return [self.generate_pdf_certificate(wipe_data) for wipe_data in wipe_data_list]
+    
     def generate_json_certificate(self, wipe_data: Dict[str, Any]) -> str:
         """Generate tamper-proof JSON certificate"""
         try:
-            # Create reports directory
-            reports_dir = Path("reports")
-            reports_dir.mkdir(exist_ok=True)
+            self._ensure_keys_exist()
             
             # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"zerotrace_certificate_{timestamp}.json"
-            filepath = reports_dir / filename
+            filepath = self._report_path(self._reports_dir, "json")
             
             # Generate certificate data
             cert_id = self._generate_certificate_id(wipe_data)
             signature_hash = self._generate_signature_hash(wipe_data)
             public_key_fingerprint = self._get_public_key_fingerprint()
+            # One clock read for every timestamp in the certificate
+            now_iso = datetime.now(timezone.utc).isoformat()
             
             certificate_data = {
                 "certificate": {
                     "id": cert_id,
                     "version": "1.0",
                     "type": "Data Destruction Certificate",
-                    "issued_at": datetime.now(timezone.utc).isoformat(),
+                    "issued_at": now_iso,
                     "issuer": "ZeroTrace Secure Data Wiping Tool",
                     "status": "valid"
                 },
@@ -383,13 +531,13 @@ class CertificateGenerator:
                     "sha256_before": wipe_data.get('sha_before'),
                     "sha256_after": wipe_data.get('sha_after'),
                     "data_destroyed": wipe_data.get('status') == 'completed',
-                    "verification_timestamp": datetime.now(timezone.utc).isoformat()
+                    "verification_timestamp": now_iso
                 },
                 "digital_signature": {
                     "algorithm": "RSA-SHA256",
                     "signature_hash": signature_hash,
                     "public_key_fingerprint": public_key_fingerprint,
-                    "signature_timestamp": datetime.now(timezone.utc).isoformat(),
+                    "signature_timestamp": now_iso,
                     "tamper_proof": True
                 },
                 "compliance": {
@@ -400,18 +548,18 @@ class CertificateGenerator:
                 },
                 "metadata": {
                     "generator": "ZeroTrace v1.0.0",
-                    "generated_at": datetime.now(timezone.utc).isoformat(),
+                    "generated_at": now_iso,
                     "certificate_format": "JSON",
                     "tamper_proof": True
                 }
             }
             
-            # Write JSON file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(certificate_data, f, indent=2, ensure_ascii=False)
+            # Serialize once in canonical form; the file holds exactly the bytes that are signed
+            canonical = _canonical_json(certificate_data)
+            filepath.write_bytes(canonical)
             
             # Generate signature file
-            self._sign_json(str(filepath), certificate_data)
+            self._sign_json(str(filepath), canonical)
             
             logger.info(f"Generated JSON certificate: {filepath}")
             return str(filepath)
@@ -420,6 +568,16 @@ class CertificateGenerator:
             logger.error(f"Failed to generate JSON certificate: {e}")
             raise
     
+    def _report_path(self, reports_dir: Path, extension: str) -> Path:
+        """Timestamped certificate path, suffixed when several are issued within the same second"""
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
+        filepath = reports_dir / f"zerotrace_certificate_{timestamp}.{extension}"
+        counter = 1
+        while filepath.exists():
+            filepath = reports_dir / f"zerotrace_certificate_{timestamp}_{counter}.{extension}"
+            counter += 1
+        return filepath
+    
     def _generate_certificate_id(self, wipe_data: Dict[str, Any]) -> str:
         """Generate unique certificate ID"""
         data_string = f"{wipe_data.get('device_path', '')}{wipe_data.get('started_at', '')}{datetime.now().isoformat()}"
@@ -430,15 +588,16 @@ class CertificateGenerator:
         data_string = f"{wipe_data.get('device_path', '')}{wipe_data.get('method', '')}{wipe_data.get('sha_after', '')}"
         return hashlib.sha256(data_string.encode()).hexdigest()
 
-    def _build_qr_payload(self, wipe_data: Dict[str, Any]) -> str:
+    def _build_qr_payload(self, wipe_data: Dict[str, Any], cert_id: Optional[str] = None,
+                          issued: Optional[datetime] = None) -> str:
         """Build a compact JSON string to encode in the QR for quick verification."""
         payload = {
-            "id": self._generate_certificate_id(wipe_data),
+            "id": cert_id or self._generate_certificate_id(wipe_data),
             "device": wipe_data.get('device_path'),
             "method": wipe_data.get('method'),
             "sha_before": wipe_data.get('sha_before'),
             "sha_after": wipe_data.get('sha_after'),
-            "issued_at": datetime.now(timezone.utc).isoformat()
+            "issued_at": (issued or datetime.now(timezone.utc)).isoformat()
         }
         return json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
 
@@ -446,9 +605,7 @@ class CertificateGenerator:
         """Generate a QR code PNG file for the provided data and return its path."""
         try:
             import qrcode
-            reports_dir = Path("reports")
-            reports_dir.mkdir(exist_ok=True)
-            qr_path = reports_dir / f"qr_{hashlib.sha256(data.encode('utf-8')).hexdigest()[:10]}.png"
+            qr_path = self._reports_dir / f"qr_{hashlib.sha256(data.encode('utf-8')).hexdigest()[:10]}.png"
             img = qrcode.make(data)
             img.save(str(qr_path))
             return str(qr_path)
@@ -457,40 +614,20 @@ class CertificateGenerator:
     
     def _get_public_key_fingerprint(self) -> str:
         """Get public key fingerprint"""
-        try:
-            with open(self.public_key_path, "rb") as f:
-                public_key_data = f.read()
-            return hashlib.sha256(public_key_data).hexdigest()[:16].upper()
-        except Exception:
-            return "UNKNOWN"
+        return getattr(self, "_pubkey_fpr", "UNKNOWN")
     
     def _get_compliance_standards(self, method: str) -> list:
         """Get compliance standards for the wipe method"""
-        standards = ["NIST 800-88"]
-        
-        if method == 'dod_5220_22_m':
-            standards.append("DoD 5220.22-M")
-        elif method == 'crypto_erase':
-            standards.append("Cryptographic Erasure")
-        elif method == 'gutmann':
-            standards.append("Gutmann Method")
-        elif method == 'ata_sanitize':
-            standards.append("ATA Sanitize")
-        elif method == 'nvme_format':
-            standards.append("NVMe Format")
-        
-        return standards
+        return list(_COMPLIANCE_STANDARDS.get(method, _BASE_COMPLIANCE))
     
     def _format_size(self, size_bytes: int) -> str:
         """Format size in human readable format"""
         if not size_bytes:
             return "Unknown"
         
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size_bytes < 1024.0:
-                return f"{size_bytes:.1f} {unit}"
-            size_bytes /= 1024.0
-        return f"{size_bytes:.1f} PB"
+        # Each unit is 2**10 of the previous one, so the bit length picks it directly
+        idx = min(max(int(size_bytes).bit_length() - 1, 0) // 10, len(_SIZE_UNITS) - 1)
+        return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
     
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human readable format"""
@@ -508,46 +645,64 @@ class CertificateGenerator:
         else:
             return f"{secs}s"
     
-    def _sign_pdf(self, filepath: str):
-        """Sign PDF with digital signature using PyHanko (detached signature saved as .p7s)"""
+    def _sign_pdf(self, pdf_buffer: io.BytesIO, filepath: str):
+        """Sign the in-memory PDF with PyHanko and write it once to filepath (detached signature saved as .p7s)"""
+        content = pdf_buffer.getvalue()
         try:
-            # Prepare signer from PEM key and self-signed certificate
-            with open(self.private_key_path, 'rb') as key_f, open(self.certificate_path, 'rb') as cert_f:
-                signer = signers.SimpleSigner.load(key_f.read(), cert_f.read(), key_passphrase=None)
+            self._ensure_keys_exist()
+            signer = self._get_pdf_signer()
+
+            if self.sign_mode == "detached":
+                # Only the external .p7s; the PDF is written as drawn, with no incremental rewrite
+                cms = signer.sign_general_data(content, 'sha256', detached=True)
+                with open(f"{filepath}.p7s", 'wb') as sigf:
+                    sigf.write(cms.dump())
+                logger.info(f"PDF signed (detached .p7s only): {filepath}")
+                return
 
-            with open(filepath, 'rb') as inf:
-                w = IncrementalPdfFileWriter(inf)
-                meta = signers.PdfSignatureMetadata(field_name='ZeroTraceSignature', md_algorithm='sha256')
-                pdf_signer = signers.PdfSigner(meta, signer)
-                with open(filepath, 'wb') as outf:
-                    pdf_signer.sign_pdf(w, output=outf)
+            pdf_buffer.seek(0)
+            w = IncrementalPdfFileWriter(pdf_buffer)
+            meta = signers.PdfSignatureMetadata(field_name='ZeroTraceSignature', md_algorithm='sha256')
+            pdf_signer = signers.PdfSigner(meta, signer)
+            signed = io.BytesIO()
+            pdf_signer.sign_pdf(w, output=signed)
+            content = signed.getvalue()
 
-            # Also export detached CMS signature for external verification
-            with open(filepath, 'rb') as f:
-                content = f.read()
-            cms = signer.sign(content, 'sha256')
+            # Also export detached CMS signature over the signed bytes for external verification
+            cms = signer.sign_general_data(content, 'sha256', detached=True)
             with open(f"{filepath}.p7s", 'wb') as sigf:
                 sigf.write(cms.dump())
 
             logger.info(f"PDF signed with PyHanko: {filepath} (.p7s saved)")
         except Exception as e:
             logger.error(f"Failed to sign PDF: {e}")
+        finally:
+            # Signed bytes on success, the unsigned document otherwise
+            with open(filepath, 'wb') as outf:
+                outf.write(content)
     
-    def _sign_json(self, filepath: str, data: Dict[str, Any]):
-        """Sign JSON certificate"""
+    def _get_pdf_signer(self):
+        """PyHanko signer from the PEM key and self-signed certificate, loaded once per instance"""
+        signer = getattr(self, "_pyhanko_signer", None)
+        if signer is None:
+            signer = signers.SimpleSigner.load(
+                str(self.private_key_path), str(self.certificate_path), key_passphrase=None
+            )
+            if signer is None:
+                raise Exception("Unable to load signing key and certificate")
+            self._pyhanko_signer = signer
+        return signer
+    
+    def _sign_json(self, filepath: str, canonical: bytes):
+        """Sign JSON certificate (``canonical`` is the serialized document as written to disk)"""
         try:
             signature_file = f"{filepath}.sig"
             
-            # Create data to sign
-            data_string = json.dumps(data, sort_keys=True, separators=(',', ':'))
-            
             # Generate signature
+            # The cached OpenSSL key keeps its CRT parameters, so each signature is one CRT modexp
             signature = self.private_key.sign(
-                data_string.encode('utf-8'),
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
+                canonical,
+                _PSS_PADDING,
                 hashes.SHA256()
             )
             
@@ -563,43 +718,74 @@ class CertificateGenerator:
     def verify_certificate(self, filepath: str) -> Dict[str, Any]:
         """Verify certificate authenticity"""
         try:
+            cache_key = None
             signature_file = f"{filepath}.sig"
             
             if not os.path.exists(signature_file):
                 return {"valid": False, "error": "Signature file not found"}
             
-            # Load public key
-            with open(self.public_key_path, "rb") as f:
-                public_key = serialization.load_pem_public_key(f.read(), backend=default_backend())
-            
             # Load signature
             with open(signature_file, "rb") as f:
                 signature = f.read()
             
-            # Verify signature
-            if filepath.endswith('.json'):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                data_string = json.dumps(data, sort_keys=True, separators=(',', ':'))
-                content = data_string.encode('utf-8')
-            else:
+            # Verify signature over the file bytes as stored
+            digest = _file_sha256(filepath)
+            
+            # Same content and signature as a previous check: only the RSA verify is skipped
+            cache_key = (digest, signature)
+            with self._verify_cache_lock:
+                cached = self._verify_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+            
+            self._ensure_keys_exist()
+            public_key = self.public_key
+            
+            try:
+                public_key.verify(
+                    signature,
+                    digest,
+                    _PSS_PADDING,
+                    Prehashed(hashes.SHA256())
+                )
+            except InvalidSignature:
+                if not filepath.endswith('.json'):
+                    raise
+                # Certificates issued before canonical files were pretty-printed on disk
+                # and signed over a re-serialization
                 with open(filepath, 'rb') as f:
                     content = f.read()
+                data_string = json.dumps(json.loads(content), sort_keys=True, separators=(',', ':'))
+                public_key.verify(
+                    signature,
+                    data_string.encode('utf-8'),
+                    _PSS_PADDING,
+                    hashes.SHA256()
+                )
             
-            public_key.verify(
-                signature,
-                content,
-                padding.PSS(
-                    mgf=padding.MGF1(hashes.SHA256()),
-                    salt_length=padding.PSS.MAX_LENGTH
-                ),
-                hashes.SHA256()
-            )
-            
-            return {"valid": True, "message": "Certificate is authentic and untampered"}
+            result = {"valid": True, "message": "Certificate is authentic and untampered"}
             
         except Exception as e:
-            return {"valid": False, "error": str(e)}
+            result = {"valid": False, "error": "Signature mismatch" if isinstance(e, InvalidSignature) else str(e)}
+            # Only a definitive verdict is remembered, not I/O or key-loading failures
+            if cache_key is None or not isinstance(e, InvalidSignature):
+                return result
+        
+        with self._verify_cache_lock:
+            if len(self._verify_cache) >= _VERIFY_CACHE_LIMIT:
+                self._verify_cache.pop(next(iter(self._verify_cache)))
+            self._verify_cache[cache_key] = result
+        return dict(result)
+
+# Shared instance, created on first use so importing this module never blocks on key generation
+_certificate_generator: Optional[CertificateGenerator] = None
+_certificate_generator_lock = threading.Lock()
 
-# Global instance
-certificate_generator = CertificateGenerator()
+def get_certificate_generator() -> CertificateGenerator:
+    """Return the shared CertificateGenerator, creating it on first call"""
+    global _certificate_generator
+    if _certificate_generator is None:
+        with _certificate_generator_lock:
+            if _certificate_generator is None:
+                _certificate_generator = CertificateGenerator()
+    return _certificate_generator
@@ -1,34 +1,36 @@
-﻿import os
+﻿import io
+import os
 import time
 import logging
 from datetime import datetime
-from typing import Dict, Any
-from .certificate_generator import certificate_generator
+from typing import Dict, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from .certificate_generator import get_certificate_generator
 
 logger = logging.getLogger(__name__)
 
-def generate_pdf_report(device, method, passes, sha_before, sha_after, status, start_ts, end_ts):
-    """Generate PDF report using the advanced certificate generator"""
+def _build_wipe_data(device, method, passes, sha_before, sha_after, status, start_ts, end_ts) -> Dict[str, Any]:
+    """Wipe details in the shape the certificate generator expects"""
+    return {
+        'device_path': device,
+        'method': method,
+        'passes': passes,
+        'sha_before': sha_before,
+        'sha_after': sha_after,
+        'status': status,
+        'started_at': datetime.fromtimestamp(start_ts).isoformat(),
+        'completed_at': datetime.fromtimestamp(end_ts).isoformat(),
+        'duration_seconds': end_ts - start_ts,
+        'device_type': 'unknown',  # Will be updated by the wipe engine
+        'model': 'Unknown',
+        'serial': 'Unknown',
+        'size': 0
+    }
+
+def _pdf_certificate(wipe_data, device, method, passes, sha_before, sha_after, status, start_ts, end_ts):
+    """PDF certificate for prepared wipe_data, falling back to the simple report"""
     try:
-        # Prepare wipe data
-        wipe_data = {
-            'device_path': device,
-            'method': method,
-            'passes': passes,
-            'sha_before': sha_before,
-            'sha_after': sha_after,
-            'status': status,
-            'started_at': datetime.fromtimestamp(start_ts).isoformat(),
-            'completed_at': datetime.fromtimestamp(end_ts).isoformat(),
-            'duration_seconds': end_ts - start_ts,
-            'device_type': 'unknown',  # Will be updated by the wipe engine
-            'model': 'Unknown',
-            'serial': 'Unknown',
-            'size': 0
-        }
-        
-        # Generate PDF certificate
-        pdf_path = certificate_generator.generate_pdf_certificate(wipe_data)
+        pdf_path = get_certificate_generator().generate_pdf_certificate(wipe_data)
         logger.info(f"Generated PDF report: {pdf_path}")
         return pdf_path
         
@@ -37,28 +39,10 @@ def generate_pdf_report(device, method, passes, sha_before, sha_after, status, s
         # Fallback to simple report
         return _generate_simple_pdf_report(device, method, passes, sha_before, sha_after, status, start_ts, end_ts)
 
-def generate_json_report(device, method, passes, sha_before, sha_after, status, start_ts, end_ts):
-    """Generate JSON report using the advanced certificate generator"""
+def _json_certificate(wipe_data):
+    """JSON certificate for prepared wipe_data, or None on failure"""
     try:
-        # Prepare wipe data
-        wipe_data = {
-            'device_path': device,
-            'method': method,
-            'passes': passes,
-            'sha_before': sha_before,
-            'sha_after': sha_after,
-            'status': status,
-            'started_at': datetime.fromtimestamp(start_ts).isoformat(),
-            'completed_at': datetime.fromtimestamp(end_ts).isoformat(),
-            'duration_seconds': end_ts - start_ts,
-            'device_type': 'unknown',  # Will be updated by the wipe engine
-            'model': 'Unknown',
-            'serial': 'Unknown',
-            'size': 0
-        }
-        
-        # Generate JSON certificate
-        json_path = certificate_generator.generate_json_certificate(wipe_data)
+        json_path = get_certificate_generator().generate_json_certificate(wipe_data)
         logger.info(f"Generated JSON report: {json_path}")
         return json_path
         
@@ -66,6 +50,26 @@ def generate_json_report(device, method, passes, sha_before, sha_after, status,
         logger.error(f"Failed to generate JSON report: {e}")
         return None
 
+def generate_pdf_report(device, method, passes, sha_before, sha_after, status, start_ts, end_ts):
+    """Generate PDF report using the advanced certificate generator"""
+    args = (device, method, passes, sha_before, sha_after, status, start_ts, end_ts)
+    return _pdf_certificate(_build_wipe_data(*args), *args)
+
+def generate_json_report(device, method, passes, sha_before, sha_after, status, start_ts, end_ts):
+    """Generate JSON report using the advanced certificate generator"""
+    return _json_certificate(_build_wipe_data(device, method, passes, sha_before, sha_after, status, start_ts, end_ts))
+
+def generate_reports(device, method, passes, sha_before, sha_after, status, start_ts, end_ts) -> Tuple[Optional[str], Optional[str]]:
+    """Generate the PDF and JSON reports concurrently from one wipe_data; returns (pdf_path, json_path)"""
+    args = (device, method, passes, sha_before, sha_after, status, start_ts, end_ts)
+    wipe_data = _build_wipe_data(*args)
+    # PDF rendering/signing and JSON signing are independent; the RSA and PDF hashing work
+    # runs in OpenSSL without the GIL, so the two overlap
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        json_future = pool.submit(_json_certificate, wipe_data)
+        pdf_future = pool.submit(_pdf_certificate, wipe_data, *args)
+        return pdf_future.result(), json_future.result()
+
 def _generate_simple_pdf_report(device, method, passes, sha_before, sha_after, status, start_ts, end_ts):
     """Fallback simple PDF report generation"""
     try:
@@ -94,10 +98,16 @@ def _generate_simple_pdf_report(device, method, passes, sha_before, sha_after, s
 def sign_report_with_openssl(pdf_path, private_key="keys/private.pem"):
     """Legacy function for backward compatibility"""
     try:
-        # Use the new certificate generator for signing
-        certificate_generator._sign_pdf(pdf_path)
-        # Prefer .p7s created by _sign_pdf
+        # Certificates from generate_pdf_certificate are signed in-process when built;
+        # re-signing would only fail on the already filled signature field
         p7s_path = f"{pdf_path}.p7s"
+        if os.path.exists(p7s_path):
+            return p7s_path
+        # Use the new certificate generator for signing (it signs in memory, then rewrites the file)
+        with open(pdf_path, 'rb') as f:
+            pdf_buffer = io.BytesIO(f.read())
+        get_certificate_generator()._sign_pdf(pdf_buffer, pdf_path)
+        # Prefer .p7s created by _sign_pdf
         if os.path.exists(p7s_path):
             return p7s_path
         # Fallback: if a .sig exists, return it
@@ -111,4 +121,4 @@ def sign_report_with_openssl(pdf_path, private_key="keys/private.pem"):
 
 def verify_certificate(filepath: str) -> Dict[str, Any]:
     """Verify certificate authenticity"""
-    return certificate_generator.verify_certificate(filepath)
+    return get_certificate_generator().verify_certificate(filepath)
@@ -0,0 +1,231 @@
+"""Qt window and wipe worker for the desktop app; imported by app.main() once the GUI is needed"""
+import os
+import sys
+import hashlib
+import mmap
+import queue
+import threading
+import time
+from datetime import datetime
+
+from PySide6 import QtWidgets, QtCore, QtGui
+
+# Backend modules (ReportLab, crypto, ...) are imported by WipeService on its first job, not at start-up
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'backend'))
+
+_HASH_CHUNK = 1024 * 1024
+# Minimum spacing between progress signals (~30 Hz); each one crosses threads and repaints
+_PROGRESS_INTERVAL = 0.033
+
+
+def _sha256_file(path: str) -> str:
+    """SHA-256 of the whole file, hashed straight from a read-only mapping of it"""
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size:
+            try:
+                # OpenSSL reads the page cache directly; no Python-side copy of the data
+                with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    return hashlib.sha256(mm).hexdigest()
+            except (OSError, ValueError, OverflowError):
+                pass
+        if hasattr(os, 'posix_fadvise'):
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        # Page-aligned (anonymous mmap) buffer, reused for every read
+        h = hashlib.sha256()
+        with mmap.mmap(-1, _HASH_CHUNK) as buf:
+            view = memoryview(buf)
+            try:
+                while True:
+                    n = f.readinto(view)
+                    if not n:
+                        break
+                    h.update(view[:n])
+            finally:
+                view.release()
+        return h.hexdigest()
+
+
+class WipeJob:
+    """A queued file wipe; cancelling it before it starts skips it"""
+
+    def __init__(self, path: str, passes: int):
+        self.path = path
+        self.passes = passes
+        self.cancelled = threading.Event()
+
+
+class WipeService(QtCore.QObject):
+    """Long-lived worker: runs queued WipeJobs one after another on its own QThread"""
+    progress_changed = QtCore.Signal(int, str)
+    finished = QtCore.Signal(bool, str, str)
+
+    def __init__(self):
+        super().__init__()
+        self.jobs = queue.Queue()
+
+    @QtCore.Slot()
+    def process(self):
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            if job.cancelled.is_set():
+                self.finished.emit(False, "Cancelled before it started", "")
+                continue
+            self._run(job)
+
+    def _run(self, job: WipeJob):
+        try:
+            from services.wipe_methods import WipeMethods
+            from utils.report import generate_reports
+
+            methods = WipeMethods(os.name)
+            start_ts = time.time()
+
+            sha_before = None
+            try:
+                sha_before = _sha256_file(job.path)
+            except Exception:
+                sha_before = None
+
+            last_pct = -1
+            last_emit = 0.0
+
+            def cb(pct: int, msg: str):
+                nonlocal last_pct, last_emit
+                pct = int(pct)
+                now = time.monotonic()
+                if pct < 100 and (pct == last_pct or now - last_emit < _PROGRESS_INTERVAL):
+                    return
+                last_pct = pct
+                last_emit = now
+                self.progress_changed.emit(pct, msg)
+
+            methods.wipe_file_clear(job.path, max(1, min(job.passes, 3)), cb)
+
+            end_ts = time.time()
+            # file deleted; sha_after None
+            pdf, json_path = generate_reports("file:" + job.path, "nist_800_88", max(1, min(job.passes, 3)), sha_before, None, "completed", start_ts, end_ts)
+            self.finished.emit(True, pdf, json_path or "")
+        except Exception as e:
+            self.finished.emit(False, str(e), "")
+
+
+class MainWindow(QtWidgets.QMainWindow):
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle("ZeroTrace Desktop - Secure Wipe")
+        self.setMinimumSize(720, 520)
+        self._init_ui()
+        self.job = None
+        # One worker thread for the window's lifetime; _start only queues jobs for it
+        self.service = WipeService()
+        self.service_thread = QtCore.QThread(self)
+        self.service.moveToThread(self.service_thread)
+        self.service_thread.started.connect(self.service.process)
+        self.service.progress_changed.connect(self._on_progress)
+        self.service.finished.connect(self._on_finished)
+        self.service_thread.start()
+
+    def _init_ui(self):
+        central = QtWidgets.QWidget()
+        layout = QtWidgets.QVBoxLayout(central)
+
+        title = QtWidgets.QLabel("ZeroTrace - Secure File Wipe")
+        title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        title.setStyleSheet("font-size: 20px; font-weight: bold;")
+        layout.addWidget(title)
+
+        form = QtWidgets.QFormLayout()
+        self.path_edit = QtWidgets.QLineEdit()
+        browse_btn = QtWidgets.QPushButton("Browse...")
+        browse_btn.clicked.connect(self._browse_file)
+        hb = QtWidgets.QHBoxLayout()
+        hb.addWidget(self.path_edit)
+        hb.addWidget(browse_btn)
+        path_widget = QtWidgets.QWidget()
+        path_widget.setLayout(hb)
+        form.addRow("File to wipe:", path_widget)
+
+        self.passes_combo = QtWidgets.QComboBox()
+        self.passes_combo.addItems(["1", "3"])
+        form.addRow("Passes:", self.passes_combo)
+
+        self.confirm_cb = QtWidgets.QCheckBox("I understand this will permanently destroy data")
+        form.addRow("", self.confirm_cb)
+
+        layout.addLayout(form)
+
+        self.progress = QtWidgets.QProgressBar()
+        self.progress.setValue(0)
+        layout.addWidget(self.progress)
+
+        self.status_label = QtWidgets.QLabel("")
+        layout.addWidget(self.status_label)
+
+        btns = QtWidgets.QHBoxLayout()
+        self.start_btn = QtWidgets.QPushButton("Start Secure Wipe")
+        self.start_btn.clicked.connect(self._start)
+        self.cancel_btn = QtWidgets.QPushButton("Cancel")
+        self.cancel_btn.setEnabled(False)
+        self.cancel_btn.clicked.connect(self._cancel)
+        btns.addWidget(self.start_btn)
+        btns.addWidget(self.cancel_btn)
+        layout.addLayout(btns)
+
+        self.setCentralWidget(central)
+
+    def _browse_file(self):
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "Select file to securely wipe")
+        if path:
+            self.path_edit.setText(path)
+
+    def _start(self):
+        path = self.path_edit.text().strip()
+        if not path or not os.path.isfile(path):
+            QtWidgets.QMessageBox.warning(self, "Invalid Path", "Please select a valid file.")
+            return
+        if not self.confirm_cb.isChecked():
+            QtWidgets.QMessageBox.warning(self, "Confirmation Required", "Please confirm you understand this is destructive.")
+            return
+        passes = int(self.passes_combo.currentText())
+
+        self.start_btn.setEnabled(False)
+        self.cancel_btn.setEnabled(True)
+        self.progress.setValue(0)
+        self.status_label.setText("Starting...")
+
+        self.job = WipeJob(path, passes)
+        self.service.jobs.put(self.job)
+
+    def _cancel(self):
+        if self.job:
+            self.job.cancelled.set()
+        self.cancel_btn.setEnabled(False)
+
+    def _on_progress(self, pct: int, msg: str):
+        self.progress.setValue(pct)
+        self.status_label.setText(msg)
+
+    def _on_finished(self, success: bool, info: str, json_path: str):
+        self.start_btn.setEnabled(True)
+        self.cancel_btn.setEnabled(False)
+        if success:
+            self.progress.setValue(100)
+            self.status_label.setText("Wipe completed. Certificate generated.")
+            QtWidgets.QMessageBox.information(self, "Success", f"Wipe complete. Certificate saved to:\n{info}")
+        else:
+            QtWidgets.QMessageBox.critical(self, "Failed", f"Wipe failed: {info}")
+
+    def closeEvent(self, event):
+        # Let a running wipe finish, then stop the worker thread
+        self.service.jobs.put(None)
+        self.service_thread.quit()
+        self.service_thread.wait()
+        super().closeEvent(event)
@@ -4,16 +4,16 @@ ZeroTrace - Secure Data Wiping Tool
 Startup script for both backend and frontend
 """
 
+import asyncio
 import os
 import sys
 import subprocess
-import time
 import signal
-import threading
+from importlib.util import find_spec
 from pathlib import Path
 
-def print_banner():
-    print("""
+# Built once at import; printed with a single write
+BANNER = """
     ╔══════════════════════════════════════════════════════════════╗
     ║                    🔒 ZeroTrace v1.0.0 🔒                    ║
     ║              Secure Data Wiping Tool - SIH25070              ║
@@ -26,29 +26,31 @@ def print_banner():
     ║  • Digital certificates and reports                         ║
     ║  • Cross-platform support                                   ║
     ╚══════════════════════════════════════════════════════════════╝
-    """)
+    
+"""
+
+def print_banner():
+    sys.stdout.write(BANNER)
+    sys.stdout.flush()
 
 def check_python_version():
     """Check if Python version is compatible"""
-    if sys.version_info < (3, 8):
-        print("❌ Error: Python 3.8 or higher is required")
+    if sys.version_info < (3, 9):
+        print("❌ Error: Python 3.9 or higher is required")
         print(f"   Current version: {sys.version}")
         sys.exit(1)
     print(f"✅ Python version: {sys.version.split()[0]}")
 
+BACKEND_DEPENDENCIES = ("fastapi", "uvicorn", "sqlalchemy", "cryptography", "reportlab")
+
 def check_dependencies():
-    """Check if required dependencies are installed"""
-    try:
-        import fastapi
-        import uvicorn
-        import sqlalchemy
-        import cryptography
-        import reportlab
-        print("✅ Backend dependencies: OK")
-    except ImportError as e:
-        print(f"❌ Missing backend dependency: {e}")
-        print("   Run: pip install -r requirements.txt")
-        sys.exit(1)
+    """Check if required dependencies are installed (located only, not imported)"""
+    for name in BACKEND_DEPENDENCIES:
+        if find_spec(name) is None:
+            print(f"❌ Missing backend dependency: No module named '{name}'")
+            print("   Run: pip install -r requirements.txt")
+            sys.exit(1)
+    print("✅ Backend dependencies: OK")
 
 def start_backend():
     """Start the FastAPI backend server"""
@@ -73,6 +75,21 @@ def start_backend():
         print(f"❌ Backend failed to start: {e}")
         sys.exit(1)
 
+def install_frontend_dependencies():
+    """Run npm install if node_modules is missing; returns True if an install ran"""
+    frontend_dir = Path(__file__).parent / "frontend" / "web"
+    if (frontend_dir / "node_modules").exists():
+        return False
+    
+    print("📦 Installing frontend dependencies...")
+    try:
+        # Explicit cwd: start_both runs this while the backend is starting
+        subprocess.run(["npm", "install"], cwd=frontend_dir, check=True)
+    except subprocess.CalledProcessError as e:
+        print(f"❌ Failed to install frontend dependencies: {e}")
+        sys.exit(1)
+    return True
+
 def start_frontend():
     """Start the React frontend development server"""
     print("🎨 Starting ZeroTrace Frontend...")
@@ -82,13 +99,7 @@ def start_frontend():
     os.chdir(frontend_dir)
     
     # Check if node_modules exists
-    if not (frontend_dir / "node_modules").exists():
-        print("📦 Installing frontend dependencies...")
-        try:
-            subprocess.run(["npm", "install"], check=True)
-        except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install frontend dependencies: {e}")
-            sys.exit(1)
+    install_frontend_dependencies()
     
     # Start the development server
     try:
@@ -99,20 +110,59 @@ def start_frontend():
         print(f"❌ Frontend failed to start: {e}")
         sys.exit(1)
 
+BACKEND_PORT = 8000
+
+async def _wait_port(host, port, process, timeout=60.0):
+    """Poll until something accepts connections on host:port (or the process exits / timeout)"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while process.returncode is None and loop.time() < deadline:
+        try:
+            _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1)
+            writer.close()
+            return True
+        except (OSError, asyncio.TimeoutError):
+            await asyncio.sleep(0.05)
+    return False
+
+async def _run_both():
+    """Run uvicorn and the Vite dev server as child processes of one event loop"""
+    root = Path(__file__).parent
+    processes = []
+    try:
+        print("🚀 Starting ZeroTrace Backend...")
+        backend = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "uvicorn",
+            "main:app",
+            "--host", "0.0.0.0",
+            "--port", str(BACKEND_PORT),
+            "--reload",
+            cwd=root / "backend"
+        )
+        processes.append(backend)
+        
+        # npm install (when needed) overlaps the backend start-up; then wait until it is listening
+        await asyncio.to_thread(install_frontend_dependencies)
+        if not await _wait_port("127.0.0.1", BACKEND_PORT, backend):
+            print("⚠️  Backend is not accepting connections yet; starting frontend anyway")
+        
+        print("🎨 Starting ZeroTrace Frontend...")
+        frontend = await asyncio.create_subprocess_exec("npm", "run", "dev", cwd=root / "frontend" / "web")
+        processes.append(frontend)
+        
+        await asyncio.gather(backend.wait(), frontend.wait())
+    finally:
+        for process in processes:
+            if process.returncode is None:
+                process.terminate()
+                await process.wait()
+
 def start_both():
     """Start both backend and frontend concurrently"""
     print("🚀 Starting ZeroTrace (Backend + Frontend)...")
     
-    # Start backend in a separate thread
-    backend_thread = threading.Thread(target=start_backend, daemon=True)
-    backend_thread.start()
-    
-    # Wait a moment for backend to start
-    time.sleep(3)
-    
-    # Start frontend
     try:
-        start_frontend()
+        asyncio.run(_run_both())
     except KeyboardInterrupt:
         print("\n🛑 ZeroTrace stopped by user")
         sys.exit(0)
@@ -121,16 +171,17 @@ def main():
     """Main entry point"""
     print_banner()
     
-    # Check system requirements
-    check_python_version()
-    check_dependencies()
-    
     # Parse command line arguments
     if len(sys.argv) > 1:
         mode = sys.argv[1].lower()
     else:
         mode = "both"
     
+    # Check system requirements (the frontend alone needs no Python packages)
+    check_python_version()
+    if mode in ("backend", "both"):
+        check_dependencies()
+    
     if mode == "backend":
         start_backend()
     elif mode == "frontend":
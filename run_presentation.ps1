@@ -86,9 +86,19 @@ Pop-Location
 # Start backend server (serves built frontend at http://127.0.0.1:8000)
 Write-Host "[2/3] Starting backend (FastAPI) on http://127.0.0.1:8000 ..." -ForegroundColor Yellow
 
-# Open browser after small delay
+# Open browser once the backend answers (short backoff poll instead of a blind delay)
 Start-Job -ScriptBlock {
-  Start-Sleep -Seconds 2
+  $delayMs = 100
+  $deadline = (Get-Date).AddSeconds(60)
+  while ((Get-Date) -lt $deadline) {
+    try {
+      Invoke-WebRequest -Uri "http://127.0.0.1:8000/docs" -UseBasicParsing -TimeoutSec 2 | Out-Null
+      break
+    } catch {
+      Start-Sleep -Milliseconds $delayMs
+      $delayMs = [Math]::Min($delayMs * 2, 1000)
+    }
+  }
   Start-Process "http://127.0.0.1:8000"
 } | Out-Null
 